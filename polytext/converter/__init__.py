@@ -1,7 +1,7 @@
 # polytext/converter/__init__.py
 from .pdf import convert_to_pdf, DocumentConverter
 from .md_to_text import md_to_text
-from .html_to_md import html_to_md
+from .html_to_md import html_to_md, html_string_to_md
 from .base import BaseConverter
 
-__all__ = ['convert_to_pdf', 'DocumentConverter', 'html_to_md', 'md_to_text', 'BaseConverter']
\ No newline at end of file
+__all__ = ['convert_to_pdf', 'DocumentConverter', 'html_to_md', 'html_string_to_md', 'md_to_text', 'BaseConverter']
\ No newline at end of file
@@ -16,7 +16,7 @@ from google.api_core import exceptions as google_exceptions
 
 from ..exceptions import EmptyDocument
 from ..prompts.transcription import AUDIO_TO_MARKDOWN_PROMPT, AUDIO_TO_PLAIN_TEXT_PROMPT
-from ..processor.audio_chunker import AudioChunker
+from ..processor.audio_chunker import AudioChunker, record_observed_tokens_per_minute
 from ..processor.text_merger import TextMerger
 from .gemini_quality_guards import extract_finish_reason, tail_has_excessive_repetition
 
@@ -47,6 +47,9 @@ AUDIO_FALLBACK_SOURCE_PATTERN = os.getenv("AUDIO_FALLBACK_SOURCE_PATTERN", "flas
 AUDIO_FALLBACK_MODEL = os.getenv("AUDIO_FALLBACK_MODEL", "gemini-3-flash-preview")
 AUDIO_FALLBACK_TEMPERATURE = float(os.getenv("AUDIO_FALLBACK_TEMPERATURE", "1.0"))
 AUDIO_FINAL_FALLBACK_MODEL = os.getenv("AUDIO_FINAL_FALLBACK_MODEL", "gemini-3.5-flash")
+# Bound on concurrent chunk transcriptions; past ~5 the LLM rate limit, not
+# wall-clock, becomes the constraint, so an unbounded pool only burns quota
+AUDIO_TRANSCRIBE_WORKERS = int(os.getenv("AUDIO_TRANSCRIBE_WORKERS", "5"))
 AUDIO_FILE_UPLOAD_THRESHOLD_BYTES = 20 * 1024 * 1024
 NO_HUMAN_SPEECH_MARKER = "no human speech detected"
 
@@ -542,7 +545,7 @@ class AudioToTextConverter:
         # Transcribe each chunk
         transcript_chunks = [""] * len(chunks)  # Pre-allocate list to maintain order
         chunk_results = [None] * len(chunks)
-        with ThreadPoolExecutor() as executor:
+        with ThreadPoolExecutor(max_workers=AUDIO_TRANSCRIBE_WORKERS) as executor:
             # Submit all chunks to the thread pool
             future_to_chunk = {
                 executor.submit(self.process_chunk, chunk, i): i
@@ -560,6 +563,11 @@ class AudioToTextConverter:
                 completion_tokens += transcript_dict["completion_tokens"]
                 prompt_tokens += transcript_dict["prompt_tokens"]
 
+        # Refine the chunk-sizing estimate with the real token rate of this
+        # file, so later chunkers in the process produce fewer, better-sized
+        # chunks instead of relying on the hardcoded default
+        record_observed_tokens_per_minute(completion_tokens, chunker.duration_ms)
+
         text_merger = TextMerger(llm_api_key=self.llm_api_key)
         # Merge all transcripts
         full_text_merged_dict = text_merger.merge_chunks_with_llm_sequential(chunks=transcript_chunks)
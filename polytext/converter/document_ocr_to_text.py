@@ -490,20 +490,10 @@ class DocumentOCRToTextConverter:
         import fitz
         from concurrent.futures import ThreadPoolExecutor, as_completed
 
-        def process_page(page_tuple):
-            page_num, page = page_tuple
-            fd, temp_image_path = tempfile.mkstemp(suffix='.png')
-            os.close(fd)
-
+        def ocr_page(page_num, temp_image_path):
             try:
-                # Convert page to image
-                pix = page.get_pixmap()
-                pix.save(temp_image_path)
-
-                # Perform OCR on the page
-                ocr_result = self.get_ocr(temp_image_path)
-                return page_num, ocr_result
-
+                # Perform OCR on the rendered page
+                return page_num, self.get_ocr(temp_image_path)
             finally:
                 if os.path.exists(temp_image_path):
                     os.remove(temp_image_path)
@@ -511,19 +501,25 @@ class DocumentOCRToTextConverter:
         try:
             pdf = fitz.open(document_for_ocr)
             start_page, end_page = self.validate_page_range(len(pdf))
-
-            # Create list of (page_num, page) tuples to process
-            pages_to_process = [(i, pdf[i]) for i in range(start_page, end_page)]
             results = []
 
-            # Process pages in parallel
+            # Pipeline pages: rendering happens sequentially here (the fitz
+            # document is not safe to touch from several threads) while the
+            # network-bound OCR of already-rendered pages runs in the pool,
+            # so OCR of page N overlaps rendering of page N+1
             with ThreadPoolExecutor() as executor:
-                future_to_page = {
-                    executor.submit(process_page, page_tuple): page_tuple[0]
-                    for page_tuple in pages_to_process
-                }
+                futures = []
+                for page_num in range(start_page, end_page):
+                    fd, temp_image_path = tempfile.mkstemp(suffix='.png')
+                    os.close(fd)
+
+                    # Convert page to image
+                    pix = pdf[page_num].get_pixmap()
+                    pix.save(temp_image_path)
+
+                    futures.append(executor.submit(ocr_page, page_num, temp_image_path))
 
-                for future in as_completed(future_to_page):
+                for future in as_completed(futures):
                     page_num, result = future.result()
                     results.append((page_num, result))
 
@@ -1,10 +1,43 @@
 from markitdown import MarkItDown
 from urllib.parse import urlparse
+from concurrent.futures import ProcessPoolExecutor
+import hashlib
 import html2text
 import requests
+import threading
 import io
+import os
+
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# Shared session so repeat fetches reuse pooled keep-alive connections and
+# retry transient gateway errors at the transport level
+_SESSION = requests.Session()
+_ADAPTER = HTTPAdapter(
+    pool_connections=32,
+    pool_maxsize=32,
+    max_retries=Retry(
+        total=3,
+        connect=3,
+        read=3,
+        backoff_factor=0.3,
+        status_forcelist=(429, 500, 502, 503, 504),
+        allowed_methods=frozenset(["GET", "HEAD"]),
+    ),
+)
+_SESSION.mount("https://", _ADAPTER)
+_SESSION.mount("http://", _ADAPTER)
+
+# Optional on-disk cache of rendered Markdown, validated with conditional
+# GETs: set the env var to a directory to enable (useful for CI, where the
+# same pages are fetched and re-converted on every run)
+HTML_CACHE_DIR = os.getenv("POLYTEXT_HTML_CACHE_DIR", "")
+
+
+def detect_type_from_url_or_headers(url: str, session: requests.Session = None) -> str:
+    session = session or _SESSION
 
-def detect_type_from_url_or_headers(url: str) -> str:
     # 1. Try URL extension
     path = urlparse(url).path.lower()
     if path.endswith(".pdf"):
@@ -14,7 +47,7 @@ def detect_type_from_url_or_headers(url: str) -> str:
 
     # 2. Fallback: make HEAD request to inspect headers
     try:
-        head = requests.head(url, allow_redirects=True, timeout=10)
+        head = session.head(url, allow_redirects=True, timeout=10)
         ctype = head.headers.get("Content-Type", "").lower()
         if "pdf" in ctype:
             return "pdf"
@@ -26,9 +59,25 @@ def detect_type_from_url_or_headers(url: str) -> str:
     # Default fallback
     return "html"
 
-def fetch_and_convert(url: str) -> str:
-    filetype = detect_type_from_url_or_headers(url)
-    md = MarkItDown()
+# Conversion runs in a process pool: MarkItDown parsing is CPU-bound and holds
+# the GIL, which would otherwise serialize concurrent fetch threads
+_CONVERT_POOL = None
+_CONVERT_POOL_LOCK = threading.Lock()
+
+
+def _get_convert_pool() -> ProcessPoolExecutor:
+    global _CONVERT_POOL
+    if _CONVERT_POOL is None:
+        with _CONVERT_POOL_LOCK:
+            if _CONVERT_POOL is None:
+                _CONVERT_POOL = ProcessPoolExecutor(max_workers=os.cpu_count())
+    return _CONVERT_POOL
+
+
+def _fetch(url: str, session: requests.Session = None) -> tuple[bytes, str, str | None]:
+    """Download a page; return its raw bytes, detected file type and ETag."""
+    session = session or _SESSION
+    filetype = detect_type_from_url_or_headers(url, session=session)
 
     headers = {
         "User-Agent": (
@@ -39,29 +88,101 @@ def fetch_and_convert(url: str) -> str:
         "Accept": "*/*",
     }
 
-    response = requests.get(url, headers=headers, timeout=20)
+    response = session.get(url, headers=headers, timeout=20)
     response.raise_for_status()
+    etag = response.headers.get("ETag")
 
     if filetype == "pdf":
-        stream = io.BytesIO(response.content)
-        return md.convert(stream, extension=".pdf").markdown
-    else:
-        stream = io.BytesIO(response.text.encode("utf-8"))
-        return md.convert(stream, extension=".html").markdown
+        return response.content, filetype, etag
+    return response.text.encode("utf-8"), filetype, etag
+
+
+def _convert(content: bytes, filetype: str) -> str:
+    """Convert fetched page bytes to Markdown (runs in a pool worker)."""
+    md = MarkItDown()
+    stream = io.BytesIO(content)
+    extension = ".pdf" if filetype == "pdf" else ".html"
+    return md.convert(stream, extension=extension).markdown
+
+
+def _cache_entry_paths(cache_dir: str, url: str) -> tuple[str, str]:
+    """Return the (markdown, etag) cache file paths for a URL."""
+    digest = hashlib.sha256(url.encode("utf-8")).hexdigest()
+    base = os.path.join(cache_dir, digest)
+    return base + ".md", base + ".etag"
+
+
+def _load_cached_markdown(url: str, session: requests.Session) -> tuple[str | None, str, str]:
+    """
+    Return (markdown, md_path, etag_path) for a cached URL.
+
+    markdown is None when the entry is missing or the server reports the
+    page changed; a 200 here is discarded on purpose — the caller refetches
+    through the normal path, keeping this a pure fast-path probe.
+    """
+    md_path, etag_path = _cache_entry_paths(HTML_CACHE_DIR, url)
+    if not (os.path.exists(md_path) and os.path.exists(etag_path)):
+        return None, md_path, etag_path
+
+    with open(etag_path, "r", encoding="utf-8") as f:
+        etag = f.read().strip()
+    try:
+        response = session.head(url, headers={"If-None-Match": etag}, allow_redirects=True, timeout=10)
+    except requests.RequestException:
+        return None, md_path, etag_path
+    if response.status_code != 304:
+        return None, md_path, etag_path
+
+    with open(md_path, "r", encoding="utf-8") as f:
+        return f.read(), md_path, etag_path
+
+
+def fetch_and_convert(url: str, session: requests.Session = None) -> str:
+    if not HTML_CACHE_DIR:
+        content, filetype, _ = _fetch(url, session=session)
+        return _get_convert_pool().submit(_convert, content, filetype).result()
+
+    os.makedirs(HTML_CACHE_DIR, exist_ok=True)
+    cached_md, md_path, etag_path = _load_cached_markdown(url, session or _SESSION)
+    if cached_md is not None:
+        return cached_md
+
+    content, filetype, etag = _fetch(url, session=session)
+    md_text = _get_convert_pool().submit(_convert, content, filetype).result()
+
+    # Only ETag-bearing responses can be revalidated cheaply later
+    if etag:
+        with open(md_path, "w", encoding="utf-8") as f:
+            f.write(md_text)
+        with open(etag_path, "w", encoding="utf-8") as f:
+            f.write(etag)
+    return md_text
+
+def html_string_to_md(html_content: str) -> dict:
+    h = html2text.HTML2Text()
+    h.ignore_links = False
+    md_text = h.handle(html_content)
+
+    return {
+        "text": md_text,
+        "completion_tokens": 0,
+        "prompt_tokens": 0,
+        "completion_model": 'not provided',
+        "completion_model_provider": 'not provided',
+        "text_chunks": 'not provided'
+    }
+
 
-def html_to_md(path_or_url: str) -> dict:
+def html_to_md(path_or_url: str, session: requests.Session = None) -> dict:
     if (
             path_or_url.startswith("http://")
             or path_or_url.startswith("https://")
             or path_or_url.startswith("www.")
     ):
-        md_text = fetch_and_convert(path_or_url)
+        md_text = fetch_and_convert(path_or_url, session=session)
     else:
         with open(path_or_url, "r", encoding="utf-8") as f:
-            html_content = f.read()
-            h = html2text.HTML2Text()
-            h.ignore_links = False
-            md_text = h.handle(html_content)
+            return html_string_to_md(f.read())
 
     return {
         "text": md_text,
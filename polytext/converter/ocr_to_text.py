@@ -4,6 +4,7 @@ import logging
 import tempfile
 import time
 import mimetypes
+from functools import lru_cache
 import ffmpeg
 from retry import retry
 from google import genai
@@ -36,6 +37,18 @@ OCR_FALLBACK_TEMPERATURE = float(os.getenv("OCR_FALLBACK_TEMPERATURE", "1.0"))
 OCR_FINAL_FALLBACK_MODEL = os.getenv("OCR_FINAL_FALLBACK_MODEL", "gemini-3.5-flash")
 
 
+@lru_cache(maxsize=4)
+def _get_genai_client(api_key: str | None):
+    """
+    Return a shared genai client for the given API key.
+
+    get_ocr runs once per image (and once per retry attempt), and client
+    construction repeats credential resolution and TLS setup each time;
+    caching the client amortizes that init cost across a whole batch.
+    """
+    return genai.Client(api_key=api_key) if api_key else genai.Client()
+
+
 def compress_and_convert_image(input_path: str, target_size=1):
     """
     Compress and convert image files to PNG format using ffmpeg.
@@ -312,10 +325,9 @@ class OCRToTextConverter:
         try:
             if self.llm_api_key:
                 logger.info("Using provided Google API key")
-                client = genai.Client(api_key=self.llm_api_key)
             else:
                 logger.info("Using Google API key from ENV")
-                client = genai.Client()
+            client = _get_genai_client(self.llm_api_key)
 
             config = types.GenerateContentConfig(
                 temperature=temperature,
@@ -1,18 +1,21 @@
 # converter/video_to_audio.py
 import os
+import shutil
 import tempfile
 import ffmpeg
 import logging
 
 logger = logging.getLogger(__name__)
 
-def convert_video_to_audio(video_file: str , bitrate_quality: int =9) -> str:
+def convert_video_to_audio(video_file: str , bitrate_quality: int =9, temp_dir: str = None) -> str:
     """
     Convert a video file to audio format using ffmpeg-python.
 
     Args:
         video_file (str): Path to the video file.
         bitrate_quality (int, optional): Variable bitrate quality from 0-9 (9 being lowest). Defaults to 9.
+        temp_dir (str, optional): Directory for the audio temp file. Defaults
+            to the system temp directory.
 
     Returns:
         str: Path to the converted audio file.
@@ -27,7 +30,7 @@ def convert_video_to_audio(video_file: str , bitrate_quality: int =9) -> str:
     temp_audio_path = None
     try:
         # Create temporary file for audio output
-        fd, temp_audio_path = tempfile.mkstemp(suffix='.mp3')
+        fd, temp_audio_path = tempfile.mkstemp(suffix='.mp3', dir=temp_dir)
         os.close(fd)
 
         # Simple efficient pipeline
@@ -40,7 +43,10 @@ def convert_video_to_audio(video_file: str , bitrate_quality: int =9) -> str:
                     q=bitrate_quality,  # Variable bitrate quality (0-9, 9 being lowest)
                     ac=1,  # Convert to mono
                     ar=16000,  # Lower sample rate
+                    map='0:a:0',  # Touch only the first audio stream
                     vn=None,
+                    sn=None,  # Skip subtitle streams
+                    dn=None,  # Skip data streams
                     threads=0,  # Use maximum available threads
                     loglevel='error',  # Reduce logging overhead
                     )
@@ -61,3 +67,68 @@ def convert_video_to_audio(video_file: str , bitrate_quality: int =9) -> str:
         if os.path.exists(temp_audio_path):
             os.unlink(temp_audio_path)
         raise
+
+
+def convert_video_stream_to_audio(video_stream, bitrate_quality: int = 9, temp_dir: str = None) -> str:
+    """
+    Convert a video byte stream to audio by piping it into ffmpeg's stdin.
+
+    Feeding ffmpeg while the stream is still being read lets download and
+    transcode overlap and skips the intermediate full-video temp file. Not
+    every container can be demuxed from a pipe (e.g. mp4 with a trailing
+    moov atom), in which case ffmpeg exits non-zero and callers should fall
+    back to the file-based path.
+
+    Args:
+        video_stream: Readable binary file-like object yielding video bytes.
+        bitrate_quality (int, optional): Variable bitrate quality from 0-9 (9 being lowest). Defaults to 9.
+        temp_dir (str, optional): Directory for the audio temp file. Defaults
+            to the system temp directory.
+
+    Returns:
+        str: Path to the converted audio file.
+
+    Raises:
+        ffmpeg.Error: If FFmpeg cannot transcode the piped stream
+    """
+
+    logger.info(f"Converting video stream to audio with bitrate quality {bitrate_quality}.")
+
+    fd, temp_audio_path = tempfile.mkstemp(suffix='.mp3', dir=temp_dir)
+    os.close(fd)
+
+    process = (
+        ffmpeg
+        .input('pipe:0')
+        .output(temp_audio_path,
+                acodec='libmp3lame',
+                q=bitrate_quality,
+                ac=1,
+                ar=16000,
+                map='0:a:0',
+                vn=None,
+                sn=None,
+                dn=None,
+                threads=0,
+                loglevel='error',
+                )
+        .overwrite_output()
+        .run_async(pipe_stdin=True)
+    )
+
+    try:
+        shutil.copyfileobj(video_stream, process.stdin, length=1 << 20)
+    except BrokenPipeError:
+        # ffmpeg stopped reading (usually an unstreamable container); its
+        # exit code below decides whether the conversion still succeeded
+        pass
+    finally:
+        process.stdin.close()
+
+    if process.wait() != 0:
+        if os.path.exists(temp_audio_path):
+            os.unlink(temp_audio_path)
+        raise ffmpeg.Error('ffmpeg', None, b'streamed conversion failed')
+
+    logger.info(f"Successfully converted video stream to audio: {temp_audio_path}")
+    return temp_audio_path
@@ -0,0 +1,72 @@
+# _result_cache.py
+# Standard library imports
+import os
+import json
+import hashlib
+import tempfile
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+def result_cache_path(temp_dir: str, local_path: str, *variant) -> str:
+    """
+    Build the cache file path for an extraction result.
+
+    The key is the SHA-256 of the local file's bytes plus any variant
+    values that change the output (output format, model, ...), so the
+    same bytes processed with the same settings always map to the same
+    entry. hashlib.file_digest streams the file without loading it into
+    memory.
+
+    Args:
+        temp_dir (str): Loader temp directory; the cache lives in a
+            "cache" subdirectory of it.
+        local_path (str): Path to the local file whose bytes key the entry.
+        *variant: Extra values that parametrize the result.
+
+    Returns:
+        str: Path of the cache entry for this (content, settings) pair.
+    """
+    with open(local_path, 'rb') as f:
+        digest = hashlib.file_digest(f, 'sha256').hexdigest()
+    suffix = '-'.join(str(v) for v in variant)
+    cache_dir = os.path.join(temp_dir, 'cache')
+    os.makedirs(cache_dir, exist_ok=True)
+    return os.path.join(cache_dir, f'{digest}-{suffix}.json')
+
+
+def load_cached_result(cache_path: str) -> dict | None:
+    """
+    Return the cached result dict, or None on a miss or unreadable entry.
+
+    Args:
+        cache_path (str): Path returned by result_cache_path().
+    """
+    try:
+        with open(cache_path, encoding='utf-8') as cached:
+            return json.load(cached)
+    except FileNotFoundError:
+        return None
+    except (OSError, ValueError):
+        logger.info(f'Discarding unreadable cache entry {cache_path}')
+        return None
+
+
+def store_cached_result(cache_path: str, result_dict: dict) -> None:
+    """
+    Atomically persist a result dict so concurrent readers never see a
+    partial entry. Cache failures are logged and swallowed — caching is
+    best-effort and must never fail the extraction that produced the result.
+
+    Args:
+        cache_path (str): Path returned by result_cache_path().
+        result_dict (dict): JSON-serializable extraction result.
+    """
+    try:
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(cache_path))
+        with os.fdopen(fd, 'w', encoding='utf-8') as tmp:
+            json.dump(result_dict, tmp)
+        os.replace(tmp_path, cache_path)
+    except (OSError, TypeError, ValueError):
+        logger.info(f'Failed to cache result at {cache_path}')
@@ -0,0 +1,82 @@
+# _tempfile_pool.py
+# Standard library imports
+import os
+import queue
+import tempfile
+import threading
+import logging
+from contextlib import contextmanager
+from functools import lru_cache
+
+logger = logging.getLogger(__name__)
+
+
+class TempFilePool:
+    """
+    Bounded pool of reusable temporary files.
+
+    Loaders that download a cloud object to a scratch file pay two syscalls
+    to create it and two more to unlink it on every call. The pool creates
+    each scratch file once and recycles its path across requests: acquire()
+    hands out an empty file, release() truncates it and puts it back. Paths
+    are recycled LIFO so a hot path stays in the dentry cache. If a consumer
+    deletes the file while holding it, release() simply recreates it.
+
+    Args:
+        dir (str): Directory the pooled files live in. Created if missing.
+        size (int, optional): Maximum number of pooled files; acquire()
+            blocks once all of them are in use. Defaults to 32.
+    """
+
+    def __init__(self, dir: str, size: int = 32) -> None:
+        self.dir = os.path.abspath(dir)
+        os.makedirs(self.dir, exist_ok=True)
+        self._size = size
+        self._paths = queue.LifoQueue(maxsize=size)
+        self._created = 0
+        self._lock = threading.Lock()
+
+    def _new_path(self) -> str:
+        fd, path = tempfile.mkstemp(prefix='pool_', dir=self.dir)
+        os.close(fd)
+        return path
+
+    @contextmanager
+    def acquire(self):
+        """
+        Borrow an empty temp file path, returning it to the pool on exit.
+
+        Yields:
+            str: Path to an existing, empty file the caller may write to.
+        """
+        try:
+            path = self._paths.get_nowait()
+        except queue.Empty:
+            with self._lock:
+                below_cap = self._created < self._size
+                if below_cap:
+                    self._created += 1
+            # Block for a released file only once the pool is at capacity
+            path = self._new_path() if below_cap else self._paths.get()
+        try:
+            yield path
+        finally:
+            self.release(path)
+
+    def release(self, path: str) -> None:
+        """
+        Truncate a borrowed file and make it available to the next caller.
+
+        Args:
+            path (str): Path previously returned by acquire().
+        """
+        # Truncates the file, recreating it if the consumer deleted it
+        with open(path, 'wb'):
+            pass
+        self._paths.put(path)
+
+
+@lru_cache(maxsize=8)
+def get_temp_file_pool(dir: str) -> TempFilePool:
+    """Return the process-wide TempFilePool for a temp directory."""
+    return TempFilePool(dir)
@@ -4,10 +4,12 @@ import logging
 import dotenv
 import mimetypes
 import json
+from collections import ChainMap
+from functools import lru_cache, partial
 import httpx
 import httpcore
 import requests
-from urllib.parse import urlparse
+import threading
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 
@@ -30,6 +32,7 @@ from ..utils.utils import clean_extracted_text_whitespace, remove_markdown_strip
 
 # External imports
 import boto3
+import botocore.config
 from google.cloud import storage
 from google.genai import errors as genai_errors
 
@@ -54,6 +57,81 @@ EMPTY_DOCUMENT_LOADER_ERROR_CODES = {
 }
 
 
+# Extension-first MIME lookup for the formats this library actually routes on,
+# checked before falling back to the full mimetypes database
+_FAST_MIME = {
+    ".jpg": "image/jpeg",
+    ".jpeg": "image/jpeg",
+    ".png": "image/png",
+    ".gif": "image/gif",
+    ".webp": "image/webp",
+    ".pdf": "application/pdf",
+    ".html": "text/html",
+    ".htm": "text/html",
+    ".md": "text/markdown",
+    ".markdown": "text/markdown",
+    ".txt": "text/plain",
+    ".mp3": "audio/mpeg",
+    ".wav": "audio/x-wav",
+    ".m4a": "audio/mp4",
+    ".mp4": "video/mp4",
+    ".mov": "video/quicktime",
+    ".webm": "video/webm",
+}
+
+
+@lru_cache(maxsize=1024)
+def _guess_mime(url: str):
+    """Memoized mimetypes.guess_type with a fast path for common extensions."""
+    extension = BaseLoader._sniff_extension(url.split("?", 1)[0].split("#", 1)[0]).lower()
+    fast = _FAST_MIME.get(extension)
+    if fast is not None:
+        return fast
+    return mimetypes.guess_type(url)[0]
+
+
+@lru_cache(maxsize=4)
+def _get_s3_client():
+    """
+    Return a shared boto3 S3 client.
+
+    Client construction resolves credentials and endpoints and sets up TLS,
+    which is expensive to repeat on every get_text call. The pool size is
+    raised above the boto3 default of 10 so the ThreadPoolExecutor fan-out in
+    run_loader_class does not exhaust the connection pool; adaptive retries
+    back off under throttling instead of hammering S3, and TCP keep-alive
+    stops idle pooled connections from being dropped between batches.
+    """
+    return boto3.session.Session().client(
+        "s3",
+        config=botocore.config.Config(
+            max_pool_connections=64,
+            retries={"max_attempts": 5, "mode": "adaptive"},
+            tcp_keepalive=True,
+        ),
+    )
+
+
+@lru_cache(maxsize=4)
+def _get_gcs_client():
+    """
+    Return a shared google.cloud.storage client, created once per process.
+
+    The underlying authorized session defaults to urllib3's pool of 10
+    connections; remounting with a larger adapter keeps concurrent blob
+    operations from queueing on connection checkout.
+    """
+    client = storage.Client()
+    try:
+        adapter = requests.adapters.HTTPAdapter(pool_connections=32, pool_maxsize=32)
+        client._http.mount("https://", adapter)
+    except AttributeError:
+        # Private transport attribute; if a client version drops it, the
+        # default pool still works
+        pass
+    return client
+
+
 def _read_bool_env(name: str, default: bool = False) -> bool:
     value = os.getenv(name)
     if value is None:
@@ -88,6 +166,9 @@ def _raise_empty_document_loader_error(error: EmptyDocument) -> None:
 
 
 class BaseLoader:
+    _executor = None
+    _executor_lock = threading.Lock()
+
     def __init__(self, markdown_output=True, llm_api_key=None, provider: str = "google", temp_dir: str = "temp",
                  ocr_model: str = "gpt-5-mini", timeout_minutes: int | None = None,
                  include_image_descriptions: bool | None = None, **kwargs):
@@ -137,6 +218,41 @@ class BaseLoader:
         self.fallback_ocr = kwargs.get("fallback_ocr", False)
         self.save_transcript_chunks = kwargs.get("save_transcript_chunks", False)
         self.bitrate_quality = kwargs.get("bitrate_quality", 9)
+        self._loader_factories = self._build_loader_factories()
+
+    def _build_loader_factories(self) -> dict:
+        """
+        Partially evaluate the loader constructors against the configuration
+        that is fixed for this BaseLoader instance.
+
+        init_loader_class runs on every get_text call; binding the per-instance
+        arguments (markdown_output, temp_dir, provider, ...) once at
+        construction time turns the per-call dispatch into a dict lookup plus
+        a direct call instead of re-assembling the same keyword arguments.
+
+        Returns:
+            dict: Mapping of loader type name to a factory callable that only
+                  needs the per-call arguments (llm_api_key, storage client details).
+        """
+        common = {
+            "markdown_output": self.markdown_output,
+            "temp_dir": self.temp_dir,
+            "timeout_minutes": self.timeout_minutes,
+        }
+        return {
+            "document_ocr": partial(DocumentOCRLoader, ocr_provider=self.provider, ocr_model=self.ocr_model,
+                                    include_image_descriptions=self.include_image_descriptions, **common),
+            "xml_xbrl": partial(XmlXbrlLoader, temp_dir=self.temp_dir, markdown_output=self.markdown_output),
+            "notebook": partial(NotebookLoader, **common),
+            "youtube": partial(YoutubeTranscriptLoaderWithLlm, **common),
+            "html": partial(HtmlLoader, markdown_output=self.markdown_output),
+            "markdown": partial(MarkdownLoader, markdown_output=self.markdown_output, temp_dir=self.temp_dir),
+            "document": partial(DocumentLoader, **common),
+            "audio": partial(AudioLoader, **common),
+            "video": partial(VideoLoader, **common),
+            "ocr": partial(OCRLoader, include_image_descriptions=self.include_image_descriptions, **common),
+            "plain_text": partial(PlainTextLoader, markdown_output=self.markdown_output, temp_dir=self.temp_dir),
+        }
 
 
     def get_text(self, input_list: list[str], **kwargs):
@@ -177,7 +293,8 @@ class BaseLoader:
             raise TypeError("Parameter 'input' must be a list of strings.")
 
         first_file_url = input_list[0]
-        kwargs = {**self.kwargs, **kwargs}
+        # ChainMap gives an O(1) merged view instead of copying both dicts on every call
+        kwargs = ChainMap(kwargs, self.kwargs)
 
         storage_client = self.initiate_storage(input=first_file_url)
         loader_class = self.init_loader_class(input=first_file_url, storage_client=storage_client, llm_api_key=self.llm_api_key, **kwargs)
@@ -245,7 +362,7 @@ class BaseLoader:
         if len(input_list) != 1:
             raise ValueError("get_beautiful_text expects exactly one input.")
 
-        kwargs = {**self.kwargs, **kwargs}
+        kwargs = ChainMap(kwargs, self.kwargs)
         raw_result = self.extract_raw_text_for_beautiful_text(input_value=input_list[0], **kwargs)
 
         converter = BeautifulTextConverter(llm_api_key=self.llm_api_key)
@@ -315,10 +432,10 @@ class BaseLoader:
         """
 
         if input.startswith("s3://"):
-            logger.info(f"Initiating S3 initialization for {input}")
-            # Initialize S3 client
-            s3_client = boto3.client("s3")
-            s3_path = input.replace("s3://", "")
+            logger.info("Initiating S3 initialization for %s", input)
+            # Reuse the process-wide S3 client and its connection pool
+            s3_client = _get_s3_client()
+            s3_path = input.removeprefix("s3://")
             parts = s3_path.split("/", 1)
 
             bucket = parts[0]
@@ -330,10 +447,10 @@ class BaseLoader:
                 "file_path": file_path,
             }
         elif input.startswith("gcs://"):
-            logger.info(f"Initializing GCS client for input: {input}")
-            # Initialize GCS client
-            gcs_client = storage.Client()
-            gcs_path = input.replace("gcs://", "")
+            logger.info("Initializing GCS client for input: %s", input)
+            # Reuse the process-wide GCS client and its connection pool
+            gcs_client = _get_gcs_client()
+            gcs_path = input.removeprefix("gcs://")
             parts = gcs_path.split("/", 1)
 
             bucket = parts[0]
@@ -344,12 +461,11 @@ class BaseLoader:
                 "document_gcs_bucket": bucket,
                 "file_path": file_path,
             }
+        # startswith takes a tuple natively, so one scan covers every web
+        # prefix (www.youtube was already covered by www.)
         elif (
-            input.startswith("http://")
-            or input.startswith("https://")
-            or input.startswith("www.")
-            or input.startswith("www.youtube")
-            or not  self.is_local_path(input)
+            input.startswith(("http://", "https://", "www."))
+            or not self.is_local_path(input)
             or self.source == "local"
         ):
             return dict()
@@ -385,64 +501,71 @@ class BaseLoader:
                 FileNotFoundError: If the input URL format is not recognized, or if it's a file path
                                    for which no suitable loader can be determined.
         """
-        parsed_url = urlparse(input)
-        mime_type, _ = mimetypes.guess_type(input)
-        kwargs = {**kwargs, **storage_client}
+        # Web and local inputs come with an empty storage_client; skip the
+        # merge layer entirely so those dispatches splat only the raw kwargs
+        if storage_client:
+            kwargs = ChainMap(storage_client, kwargs)
         file_extension = None
 
+        # Cheap scheme/extension sniff via str methods instead of a full urlparse
+        scheme, scheme_sep, remainder = input.partition("://")
+        if not scheme_sep:
+            scheme = ""
+
         # Try extracting the extension from the URL or local path
-        if parsed_url.scheme:  # If is URL (http, https, gs, s3, etc.)
-            path_without_query = parsed_url.path
+        if scheme:  # If is URL (http, https, gs, s3, etc.)
+            # Skip the netloc: only the path after the first "/" can carry an extension
+            path_without_query = remainder.partition("/")[2].split("?", 1)[0].split("#", 1)[0]
             if path_without_query:
-                _, file_extension = os.path.splitext(path_without_query)
+                file_extension = self._sniff_extension(path_without_query)
         else:  # If is local file path (without schema)
             if os.path.exists(input):
-                _, file_extension = os.path.splitext(input)
+                file_extension = self._sniff_extension(input)
 
         if file_extension:
             file_extension = file_extension.lower()
 
+        factories = self._loader_factories
+
         if is_document_fallback:
-            return DocumentOCRLoader(llm_api_key=llm_api_key, markdown_output=self.markdown_output, temp_dir=self.temp_dir, timeout_minutes=self.timeout_minutes, ocr_provider=self.provider, ocr_model=self.ocr_model, include_image_descriptions=self.include_image_descriptions, **kwargs)
+            return factories["document_ocr"](llm_api_key=llm_api_key, **kwargs)
 
         if file_extension in [".xml", ".xbrl"]:
-            return XmlXbrlLoader(temp_dir=self.temp_dir, markdown_output=self.markdown_output, **kwargs)
+            return factories["xml_xbrl"](**kwargs)
 
         if file_extension == ".ipynb":
-            return NotebookLoader(llm_api_key=llm_api_key, markdown_output=self.markdown_output, temp_dir=self.temp_dir, timeout_minutes=self.timeout_minutes, **kwargs)
-
-        if parsed_url.scheme in ["http", "https"] or input.startswith("www."):
-            if "youtube.com" in parsed_url.netloc or "youtu.be" in parsed_url.netloc:
-                return YoutubeTranscriptLoaderWithLlm(llm_api_key=llm_api_key, markdown_output=self.markdown_output, temp_dir=self.temp_dir, timeout_minutes=self.timeout_minutes, **kwargs)
+            return factories["notebook"](llm_api_key=llm_api_key, **kwargs)
+
+        if scheme in ["http", "https"] or input.startswith("www."):
+            # The netloc sits right after the scheme separator (inputs without
+            # a scheme have no netloc)
+            netloc = remainder.partition("/")[0] if scheme_sep else ""
+            if "youtube.com" in netloc or "youtu.be" in netloc:
+                return factories["youtube"](llm_api_key=llm_api_key, **kwargs)
             else:
-                return HtmlLoader(markdown_output=self.markdown_output)
+                return factories["html"]()
+
+        # MIME guessing is only relevant past the URL branches above
+        mime_type = _guess_mime(input)
+
         # Handle markdown files based on extension or MIME type
         if file_extension in [".md", ".markdown"] or (
                 mime_type and mime_type.startswith("text/markdown")
         ):
-            return MarkdownLoader(
-                markdown_output=self.markdown_output,
-                temp_dir=self.temp_dir,
-                **kwargs,
-            )
+            return factories["markdown"](**kwargs)
         elif mime_type:
             if file_extension in [".pdf", ".xlsx", ".docx", ".txt", ".csv", ".odt", ".pptx", ".xls", ".doc", ".ppt", ".rtf"]:
-                return DocumentLoader(markdown_output=self.markdown_output, temp_dir=self.temp_dir, timeout_minutes=self.timeout_minutes, **kwargs)
+                return factories["document"](**kwargs)
             elif mime_type.startswith("audio/"):
-                return AudioLoader(llm_api_key=llm_api_key, markdown_output=self.markdown_output, temp_dir=self.temp_dir, timeout_minutes=self.timeout_minutes, **kwargs)
+                return factories["audio"](llm_api_key=llm_api_key, **kwargs)
             elif mime_type.startswith("video/"):
-                return VideoLoader(llm_api_key=llm_api_key, markdown_output=self.markdown_output, temp_dir=self.temp_dir, timeout_minutes=self.timeout_minutes, **kwargs)
+                return factories["video"](llm_api_key=llm_api_key, **kwargs)
             elif mime_type.startswith("image/"):
-                return OCRLoader(llm_api_key=llm_api_key, markdown_output=self.markdown_output, temp_dir=self.temp_dir, timeout_minutes=self.timeout_minutes, include_image_descriptions=self.include_image_descriptions, **kwargs)
+                return factories["ocr"](llm_api_key=llm_api_key, **kwargs)
             elif mime_type.startswith("text/markdown"):
-                return MarkdownLoader(markdown_output=self.markdown_output, temp_dir=self.temp_dir, **kwargs)
+                return factories["markdown"](**kwargs)
             elif mime_type == "text/html":
-                return PlainTextLoader(
-                    llm_api_key=llm_api_key,
-                    markdown_output=self.markdown_output,
-                    temp_dir=self.temp_dir,
-                    **kwargs,
-                )
+                return factories["plain_text"](llm_api_key=llm_api_key, **kwargs)
             else:
                 try:
                     raise ValueError(f"Unsupported MIME type: {mime_type}")
@@ -451,15 +574,25 @@ class BaseLoader:
                     raise
 
         elif self.validate_user_text(text=input):
-            return PlainTextLoader(
-                llm_api_key=llm_api_key,
-                markdown_output=self.markdown_output,
-                temp_dir=self.temp_dir,
-                **kwargs,
-            )
+            return factories["plain_text"](llm_api_key=llm_api_key, **kwargs)
 
         raise FileNotFoundError(f"Input not found or format not recognized: {input}")
 
+    @staticmethod
+    def _sniff_extension(path_value: str) -> str:
+        """
+        Extract the trailing file extension (with dot) from a path, or "" if none.
+
+        Equivalent to os.path.splitext on the final path segment but built on
+        the C-implemented str.rpartition, which is noticeably cheaper on the
+        per-call dispatch path.
+        """
+        tail = path_value.rpartition("/")[2]
+        name, dot, extension = tail.rpartition(".")
+        if not dot or not name.strip("."):
+            return ""
+        return "." + extension
+
     @staticmethod
     def parse_input(input_string: str):
         if not input_string:
@@ -472,7 +605,7 @@ class BaseLoader:
         else:
             return {"file_path": input_string}
 
-        path = input_string.replace(prefix, "")
+        path = input_string.removeprefix(prefix)
         parts = path.split("/", 1)
         bucket = parts[0]
 
@@ -483,7 +616,91 @@ class BaseLoader:
             "file_path": file_path
         }
 
-    def run_loader_class(self, loader_class: any, input_list: list[str]) -> dict:
+    @classmethod
+    def _get_executor(cls) -> ThreadPoolExecutor:
+        """
+        Return the shared thread pool used for multi-image fan-out.
+
+        The work is network-bound, so the worker count follows the
+        POLYTEXT_OCR_WORKERS env var (default 16, matching the storage client
+        connection pool) rather than the CPU count, and the pool is kept alive
+        across calls so thread startup is paid once per process.
+        """
+        if cls._executor is None:
+            with cls._executor_lock:
+                if cls._executor is None:
+                    cls._executor = ThreadPoolExecutor(
+                        max_workers=int(os.getenv("POLYTEXT_OCR_WORKERS", "16")),
+                        thread_name_prefix="polytext-ocr",
+                    )
+        return cls._executor
+
+    def _iter_loader_results(self, loader_class: any, input_list: list[str]):
+        """
+        Yield `(index, result)` tuples as each input finishes loading.
+
+        Results arrive in completion order, not input order; the index allows
+        the caller to reorder if needed. Compared to materializing the full
+        result list, this keeps at most one un-consumed result in memory and
+        lets downstream processing start before the slowest input finishes.
+
+        Args:
+            loader_class (object): An instance of a content loader class capable of processing the input type.
+            input_list (list[str]): List of input strings (URLs or file paths) to process.
+
+        Yields:
+            tuple[int, dict]: The input's position in `input_list` and its extraction result.
+        """
+        executor = self._get_executor()
+        # Parse the whole batch once up front instead of re-running the
+        # prefix/bucket split inside the submission loop
+        file_paths = self.parse_input_list(input_list=input_list)
+        future_to_index = {
+            executor.submit(loader_class.load, input_path=file_path): idx
+            for idx, file_path in enumerate(file_paths)
+        }
+        for future in as_completed(future_to_index):
+            yield future_to_index[future], future.result()
+
+    @classmethod
+    def parse_input_list(cls, input_list: list[str]) -> list[str]:
+        """
+        Parse a batch of input strings into bucket-relative file paths.
+
+        Equivalent to calling parse_input on each item but done in a single
+        pass so the per-item dict allocations stay out of the hot submission
+        loop in _iter_loader_results.
+
+        Args:
+            input_list (list[str]): Input strings (URLs or file paths) to parse.
+
+        Returns:
+            list[str]: The file path of each input, in input order.
+        """
+        first = input_list[0] if input_list else ""
+        if first.startswith("s3://"):
+            prefix = "s3://"
+        elif first.startswith("gcs://"):
+            prefix = "gcs://"
+        else:
+            prefix = None
+
+        if prefix is None:
+            return [cls.parse_input(input_string=s)["file_path"] for s in input_list]
+
+        # Common case: the whole batch shares one scheme, so detect the prefix
+        # once and strip it with removeprefix instead of re-matching per item
+        file_paths = []
+        for input_string in input_list:
+            if not input_string.startswith(prefix):
+                file_paths.append(cls.parse_input(input_string=input_string)["file_path"])
+                continue
+            path = input_string.removeprefix(prefix)
+            parts = path.split("/", 1)
+            file_paths.append(parts[1] if len(parts) > 1 else "")
+        return file_paths
+
+    def run_loader_class(self, loader_class: any, input_list: list[str], stream: bool = False) -> dict:
         """
         Executes the provided loader class to extract and aggregate content from one or more input sources.
 
@@ -492,6 +709,9 @@ class BaseLoader:
         Args:
             loader_class (object): An instance of a content loader class (e.g., HtmlLoader, OCRLoader, AudioLoader) capable of processing the input type.
             input_list (list[str]): List of one or more input strings (URLs or file paths) to process.
+            stream (bool, optional): If True, return the `(index, result)` generator from
+                `_iter_loader_results` instead of an aggregated dict, leaving aggregation
+                to the caller. Defaults to False.
 
         Returns:
             dict: Aggregated extraction results with the following keys:
@@ -509,48 +729,22 @@ class BaseLoader:
             ValueError: If input_list is empty or contains unsupported input types for multi-input processing.
         """
 
-        result_dict = {}
-
         # Empty Input
         if not input_list:
             raise ValueError("Input list is empty.")
 
-        first_mime_type, _ = mimetypes.guess_type(input_list[0])
+        first_mime_type = _guess_mime(input_list[0])
+        mime_bucket = first_mime_type.split("/", 1)[0] if first_mime_type else None
         is_multi_input = len(input_list) > 1
-        is_image_type = first_mime_type and first_mime_type.startswith("image")
-
-        # More images inputs (parallelization)
-        if is_multi_input and is_image_type:
-            with ThreadPoolExecutor() as executor:
-                # Associate each future with its original index
-                future_to_index = {
-                    executor.submit(loader_class.load, input_path=self.parse_input(input_string=s)["file_path"]): idx
-                    for idx, s in enumerate(input_list)
-                }
 
-                # Prepare a list for the results, sorted by index
-                results = [None] * len(input_list)
-                for future in as_completed(future_to_index):
-                    idx = future_to_index[future]
-                    results[idx] = future.result()
-
-                # Rebuild result_dict keeping the order
-                result_dict["text"] = "\n".join(r.get("text", "") for r in results)
-                result_dict["completion_tokens"] = sum(r.get("completion_tokens", 0) for r in results)
-                result_dict["prompt_tokens"] = sum(r.get("prompt_tokens", 0) for r in results)
-                result_dict["completion_model"] = results[0].get("completion_model", "not provided")
-                result_dict["completion_model_provider"] = results[0].get("completion_model_provider", "not provided")
-                result_dict["text_chunks"] = results[0].get("text_chunks", "not provided")
-                result_dict["type"] = results[0].get("type", "not provided")
-                result_dict["input"] = results[0].get("input", "not provided")
-
-        elif is_multi_input and not is_image_type:
-            error_msg = f"Unsupported input: multiple inputs ({len(input_list)} provided) are not all image types (first type: {first_mime_type}). Multi-threading is only supported for multiple images."
-            logger.info(error_msg)
-            raise ValueError(error_msg)
+        if stream and (is_multi_input, mime_bucket) in self._RUN_HANDLERS:
+            return self._iter_loader_results(loader_class=loader_class, input_list=input_list)
 
-        else:
-            result_dict = loader_class.load(input_path=self.parse_input(input_string=input_list[0])["file_path"])
+        handler = self._RUN_HANDLERS.get((is_multi_input, mime_bucket))
+        if handler is None:
+            handler = BaseLoader._raise_unsupported_batch if is_multi_input else BaseLoader._load_single
+        result_dict = handler(self, loader_class=loader_class, input_list=input_list,
+                              first_mime_type=first_mime_type)
 
         result_dict["text"] = clean_extracted_text_whitespace(remove_markdown_strip(result_dict["text"]))
 
@@ -563,6 +757,74 @@ class BaseLoader:
 
         return result_dict
 
+    def _load_image_batch(self, loader_class: any, input_list: list[str], first_mime_type: str = None) -> dict:
+        """
+        Load several images in parallel and aggregate their results in input order.
+
+        Args:
+            loader_class (object): An instance of a content loader class capable of processing images.
+            input_list (list[str]): Image URLs or file paths to process.
+            first_mime_type (str, optional): MIME type of the first input (unused here).
+
+        Returns:
+            dict: Aggregated extraction result across the batch.
+        """
+        result_dict = {}
+
+        # Each duplicated input would trigger its own OCR call, the most
+        # expensive step of the pipeline; fan out over unique inputs only
+        # and broadcast the results back over the original order
+        unique_inputs = list(dict.fromkeys(input_list))
+        file_paths = self.parse_input_list(input_list=unique_inputs)
+
+        # executor.map keeps input order without a Future-per-item dict;
+        # fold each result into the running totals as it arrives so only
+        # the per-input texts (needed for the ordered join) stay in memory
+        result_by_input = {}
+        total_completion_tokens = 0
+        total_prompt_tokens = 0
+        for idx, result in enumerate(self._get_executor().map(loader_class.load, file_paths)):
+            result_by_input[unique_inputs[idx]] = result
+            total_completion_tokens += result.get("completion_tokens", 0)
+            total_prompt_tokens += result.get("prompt_tokens", 0)
+        first_result = result_by_input[input_list[0]]
+
+        # Rebuild result_dict keeping the order; token totals reflect the
+        # calls actually made, while duplicated inputs repeat their text
+        result_dict["text"] = "\n".join(result_by_input[s].get("text", "") for s in input_list)
+        result_dict["completion_tokens"] = total_completion_tokens
+        result_dict["prompt_tokens"] = total_prompt_tokens
+        result_dict["completion_model"] = first_result.get("completion_model", "not provided")
+        result_dict["completion_model_provider"] = first_result.get("completion_model_provider", "not provided")
+        result_dict["text_chunks"] = first_result.get("text_chunks", "not provided")
+        result_dict["type"] = first_result.get("type", "not provided")
+        result_dict["input"] = first_result.get("input", "not provided")
+        return result_dict
+
+    def _load_single(self, loader_class: any, input_list: list[str], first_mime_type: str = None) -> dict:
+        """Load the one and only input with the resolved loader."""
+        return loader_class.load(input_path=self.parse_input(input_string=input_list[0])["file_path"])
+
+    def _raise_unsupported_batch(self, loader_class: any, input_list: list[str], first_mime_type: str = None) -> dict:
+        """Reject multi-input batches that are not uniformly images."""
+        # NOTE: there is no serial multi-file branch to prefetch downloads for:
+        # non-image batches are rejected here, and the image batch handler
+        # already overlaps download and OCR inside its worker threads.
+        logger.info(
+            "Unsupported input: multiple inputs (%d provided) are not all image types (first type: %s). Multi-threading is only supported for multiple images.",
+            len(input_list), first_mime_type,
+        )
+        raise ValueError(
+            f"Unsupported input: multiple inputs ({len(input_list)} provided) are not all image types (first type: {first_mime_type}). Multi-threading is only supported for multiple images."
+        )
+
+    # Dispatch table for run_loader_class keyed on (is_multi_input, mime bucket);
+    # unknown multi-input combinations fall back to _raise_unsupported_batch,
+    # everything single-input to _load_single
+    _RUN_HANDLERS = {
+        (True, "image"): _load_image_batch,
+    }
+
 # Helper methods
     @staticmethod
     def is_local_path(s: str) -> bool:
@@ -1,11 +1,16 @@
 # document.py
 # Standard library imports
+import io
 import os
 import re
+import mmap
+import hashlib
 import tempfile
 import logging
+import multiprocessing
 import concurrent.futures
 from collections import Counter
+from functools import lru_cache
 from pymupdf4llm import to_markdown
 from markitdown import MarkItDown
 
@@ -23,6 +28,102 @@ logger = logging.getLogger(__name__)
 
 MIN_DOC_TEXT_LENGHT_ACCEPTED = int(os.getenv("MIN_DOC_TEXT_LENGHT_ACCEPTED", "400"))
 
+# clean_text runs once per page; compile its pattern and translation table once
+_BLANK_LINE_RE = re.compile(r"\n\s*\n")
+_CLEAN_TRANS = str.maketrans({'"': "'"})
+
+# Alphanumeric (Unicode-aware): \w minus the underscore. Counting matches in C
+# beats a per-character isalnum() loop in has_low_text_quality
+_ALNUM_RE = re.compile(r"[^\W_]")
+
+# A run of Unicode replacement characters this long marks a PDF whose fonts
+# PyMuPDF cannot decode; such documents are retried with pypdf
+_BAD_MARKER = "�" * 42
+
+# Page-extraction worker pool sizing: PyMuPDF's layout analysis is CPU-bound,
+# so workers beyond the core count (capped at 4) stop helping, and short
+# documents are not worth the process startup cost
+PAGE_EXTRACTION_WORKERS = min(os.cpu_count() or 1, 4)
+PAGE_EXTRACTION_MIN_PAGES = int(os.getenv("PAGE_EXTRACTION_MIN_PAGES", "32"))
+
+# Dehyphenate only; ligature/whitespace preservation and image extraction are
+# MuPDF's expensive reconstruction passes and stay off
+TEXT_EXTRACTION_FLAGS = fitz.TEXT_DEHYPHENATE
+
+# Per-process document handle for the page-extraction pool; each worker opens
+# the PDF once in _init_page_worker instead of per page
+_worker_pdf = None
+
+
+def _init_page_worker(pdf_source) -> None:
+    global _worker_pdf
+    if isinstance(pdf_source, bytes):
+        _worker_pdf = fitz.open(stream=pdf_source, filetype="pdf")
+    else:
+        _worker_pdf = fitz.open(pdf_source)
+
+
+def _extract_page(page_number: int) -> tuple[int, str]:
+    page = _worker_pdf.load_page(page_number)
+    return page_number, page.get_text("text", flags=TEXT_EXTRACTION_FLAGS)
+
+
+@lru_cache(maxsize=256)
+def _resolve_s3_key(s3_client, bucket: str, file_path: str) -> str | None:
+    """
+    Find the real S3 key for a path whose case or extension may differ.
+
+    One list_objects_v2 call on the key's stem replaces blind per-variant
+    download retries (each a full round trip). Results are cached so
+    repeated lookups of the same document cost nothing.
+
+    Args:
+        s3_client: Boto3 S3 client.
+        bucket (str): Bucket to search.
+        file_path (str): Requested key.
+
+    Returns:
+        str | None: The matching key, or None if nothing under the stem matches.
+    """
+    prefix = os.path.splitext(file_path)[0]
+    # Only extension/case variants of one document can match the stem, so a
+    # small MaxKeys caps the response size instead of pulling up to 1000 keys
+    response = s3_client.list_objects_v2(Bucket=bucket, Prefix=prefix, MaxKeys=100)
+    keys = [obj["Key"] for obj in response.get("Contents", [])]
+
+    if file_path in keys:
+        return file_path
+    for key in keys:
+        if key.lower() == file_path.lower():
+            return key
+    return None
+
+
+class _RowRepeatTracker:
+    """
+    Incrementally count repeated rows across appended pages.
+
+    Feeding pages as they are extracted keeps the repeated-rows quality
+    check O(rows) overall, instead of re-splitting and re-counting the
+    accumulated text every time the check runs.
+    """
+
+    def __init__(self) -> None:
+        self._counts = Counter()
+        self._max_count = 0
+
+    def add_page(self, page_text: str) -> None:
+        for row in page_text.split("\n"):
+            if row.strip():
+                count = self._counts[row] + 1
+                self._counts[row] = count
+                if count > self._max_count:
+                    self._max_count = count
+
+    def exceeds(self, threshold: int) -> bool:
+        return self._max_count >= threshold
+
+
 class DocumentLoader:
     """
     Loads and extracts text from documents with support for cloud storage (S3 or GCS).
@@ -46,7 +147,9 @@ class DocumentLoader:
     def __init__(self, source: str, markdown_output: bool = True, s3_client: object = None,
                  document_aws_bucket: str = None, gcs_client: object = None,
                  document_gcs_bucket: str = None, temp_dir: str = 'temp',
-                 page_range: tuple[int, int] = None, timeout_minutes: int = None, **kwargs) -> None:
+                 page_range: tuple[int, int] = None, timeout_minutes: int = None,
+                 pdf_cache_enabled: bool = False, pdf_cache_prefix: str = 'polytext-pdf-cache',
+                 **kwargs) -> None:
         """
         Initialize DocumentLoader with optional cloud storage configuration.
 
@@ -60,6 +163,9 @@ class DocumentLoader:
             temp_dir (str): Directory for temporary files (default: 'temp')
             page_range (tuple): Optional page range to extract (start, end)
             timeout (int): Timeout for converting to markdown (default: None)
+            pdf_cache_enabled (bool): Whether to cache LibreOffice-converted PDFs
+                in S3 under a content-hash key (default: False)
+            pdf_cache_prefix (str): Key prefix for cached PDFs (default: 'polytext-pdf-cache')
 
         Raises:
             ValueError: If source is not "cloud" or "local"
@@ -74,6 +180,8 @@ class DocumentLoader:
         self.type = "document"
         self.page_range = page_range
         self.timeout_minutes = timeout_minutes
+        self.pdf_cache_enabled = pdf_cache_enabled
+        self.pdf_cache_prefix = pdf_cache_prefix
 
         # Set up custom temp directory
         self.temp_dir = os.path.abspath(temp_dir)
@@ -107,8 +215,13 @@ class DocumentLoader:
                 logger.info(f'Downloaded {file_path} to {temp_file_path}')
             except ClientError as e:
                 logger.info(e)
+                # Resolve the real key with one listing instead of guessing
+                # case variants with further download round trips
+                resolved_key = _resolve_s3_key(self.s3_client, self.document_aws_bucket, file_path)
+                if resolved_key is None:
+                    raise
                 self.s3_client.download_file(Bucket=self.document_aws_bucket,
-                                             Key=file_path.replace(".pdf", ".PDF"),
+                                             Key=resolved_key,
                                              Filename=temp_file_path)
             return temp_file_path
         elif self.gcs_client is not None:
@@ -125,6 +238,48 @@ class DocumentLoader:
             return temp_file_path
         raise AttributeError('Storage client not provided')
 
+    def _download_document_bytes(self, file_path: str) -> bytes:
+        """
+        Download a document from cloud storage straight into memory.
+
+        PDFs can be handed to the parsers as a byte stream, so for them
+        the temp-file write plus read-back of download_document is wasted
+        disk I/O. Uses the same key-resolution fallback as the on-disk path.
+
+        Args:
+            file_path (str): Cloud storage path of the document
+
+        Returns:
+            bytes: The raw document content
+
+        Raises:
+            ClientError: If cloud storage operations fail
+            AttributeError: If no storage client is configured
+        """
+        if self.s3_client is not None:
+            buf = io.BytesIO()
+            try:
+                self.s3_client.download_fileobj(Bucket=self.document_aws_bucket, Key=file_path, Fileobj=buf)
+            except ClientError as e:
+                logger.info(e)
+                resolved_key = _resolve_s3_key(self.s3_client, self.document_aws_bucket, file_path)
+                if resolved_key is None:
+                    raise
+                buf = io.BytesIO()
+                self.s3_client.download_fileobj(Bucket=self.document_aws_bucket, Key=resolved_key, Fileobj=buf)
+            logger.info(f'Downloaded {file_path} into memory')
+            return buf.getvalue()
+        elif self.gcs_client is not None:
+            bucket = self.gcs_client.bucket(self.document_gcs_bucket)
+            try:
+                data = bucket.blob(file_path).download_as_bytes()
+            except Exception as e:
+                logger.info(e)
+                data = bucket.blob(file_path.replace(".pdf", ".PDF")).download_as_bytes()
+            logger.info(f'Downloaded {file_path} into memory')
+            return data
+        raise AttributeError('Storage client not provided')
+
     def convert_doc_to_pdf(self, file_prefix: str, input_file: str) -> str:
         """
         Convert any document format to PDF using cloud storage and LibreOffice.
@@ -153,12 +308,56 @@ class DocumentLoader:
         fd, output_file = tempfile.mkstemp(suffix=".pdf")
         os.close(fd)  # Close file descriptor explicitly
 
+        # A LibreOffice run costs seconds to minutes of CPU; a content-hash
+        # cache in S3 turns repeat conversions of the same source into one GET
+        cache_key = None
+        if self.pdf_cache_enabled and self.s3_client is not None:
+            digest = self._hash_file(input_file)
+            cache_key = f"{self.pdf_cache_prefix}/{digest}.pdf"
+            try:
+                self.s3_client.head_object(Bucket=self.document_aws_bucket, Key=cache_key)
+            except ClientError:
+                logger.info(f"PDF cache miss for {cache_key}")
+            else:
+                self.s3_client.download_file(Bucket=self.document_aws_bucket, Key=cache_key,
+                                             Filename=output_file)
+                logger.info(f"PDF cache hit for {cache_key}")
+                os.remove(input_file)
+                return output_file
+
         logger.info("Using LibreOffice")
         convert_to_pdf(input_file=input_file, output_file=output_file, original_file=file_prefix)
         logger.info(f"Document converted to pdf and saved to {output_file}")
         os.remove(input_file)
+
+        if cache_key is not None:
+            # Best effort: a failed upload only means the next conversion
+            # pays for LibreOffice again
+            try:
+                self.s3_client.upload_file(output_file, self.document_aws_bucket, cache_key)
+                logger.info(f"Cached converted PDF at {cache_key}")
+            except Exception as e:
+                logger.info(f"Failed to cache converted PDF: {e}")
+
         return output_file
 
+    @staticmethod
+    def _hash_file(path: str) -> str:
+        """
+        Compute the SHA-256 hex digest of a file, streaming in 1 MiB chunks.
+
+        Args:
+            path (str): File to hash
+
+        Returns:
+            str: Hex digest of the file content
+        """
+        digest = hashlib.sha256()
+        with open(path, "rb") as f:
+            for chunk in iter(lambda: f.read(1 << 20), b""):
+                digest.update(chunk)
+        return digest.hexdigest()
+
     # PDF text extraction methods
 
     def get_document_text(self, file_path: str) -> dict:
@@ -190,138 +389,189 @@ class DocumentLoader:
         """
         logger.debug("Using PyMuPDF")
 
+        pdf_data = None
+        temp_file_path = None
         if self.source == "cloud":
-            fd, temp_file_path = tempfile.mkstemp()
-            try:
-                temp_file_path = self.download_document(file_path, temp_file_path)
+            if os.path.splitext(file_path)[1].lower() == ".pdf":
+                # PDFs parse fine from memory, so skip the temp-file write
+                # and read-back entirely; non-PDFs still need a file on disk
+                # for the LibreOffice conversion
+                pdf_data = self._download_document_bytes(file_path)
                 logger.info(f"Successfully loaded document from {file_path}")
-            finally:
-                os.close(fd)
+            else:
+                fd, temp_file_path = tempfile.mkstemp(suffix=os.path.splitext(file_path)[1])
+                try:
+                    temp_file_path = self.download_document(file_path, temp_file_path)
+                    logger.info(f"Successfully loaded document from {file_path}")
+                finally:
+                    os.close(fd)
         elif self.source == "local":
             temp_file_path = file_path
             logger.info(f"Successfully loaded document from local path {file_path}")
         else:
             raise ValueError("Invalid OCR source. Choose 'cloud' or 'local'.")
 
-        # Handle PDF conversion and opening
-        if os.path.splitext(file_path)[1].lower() != ".pdf":
-            logger.info("Converting file to PDF")
-            file_prefix = file_path
-            temp_file_path = self.convert_doc_to_pdf(file_prefix=file_prefix, input_file=temp_file_path)
-            pdf_document = fitz.open(temp_file_path)
-        else:
-            try:
-                pdf_document = fitz.open(temp_file_path)
-                logger.info(f"Successfully opened file with temp_file_path: {temp_file_path}")
-            except Exception as e:
+        pdf_document = None
+        try:
+            # Handle PDF conversion and opening
+            if pdf_data is not None:
+                try:
+                    pdf_document = fitz.open(stream=pdf_data, filetype="pdf")
+                    logger.info("Successfully opened in-memory document")
+                except Exception as e:
+                    # Strange PDF that needs the conversion fallback, which
+                    # requires a filename on disk
+                    logger.info("Converting file to PDF")
+                    fd, temp_file_path = tempfile.mkstemp(suffix=".pdf")
+                    with os.fdopen(fd, "wb") as f:
+                        f.write(pdf_data)
+                    pdf_data = None
+                    temp_file_path = self.convert_doc_to_pdf(file_prefix=file_path, input_file=temp_file_path)
+                    pdf_document = fitz.open(temp_file_path)
+            elif os.path.splitext(file_path)[1].lower() != ".pdf":
                 logger.info("Converting file to PDF")
                 file_prefix = file_path
                 temp_file_path = self.convert_doc_to_pdf(file_prefix=file_prefix, input_file=temp_file_path)
                 pdf_document = fitz.open(temp_file_path)
-
-        total_pages = pdf_document.page_count
-        logger.info(f"Total pages: {total_pages}")
-
-        # Validate and adjust page range
-        start_page, end_page = self.validate_page_range(total_pages)
-
-        try_not_markdown = True
-        if self.markdown_output:
-            # Use pymupdf4llm for markdown conversion
-            logger.info("Converting file to Markdown")
-
-            executor = concurrent.futures.ThreadPoolExecutor(max_workers=1)
-            future = executor.submit(to_markdown, pdf_document, pages=list(range(start_page, end_page)))
-            try:
-                import time
-                logger.info(f"Timeout_minutes: {self.timeout_minutes}")
-                start = time.time()
-                text = future.result(timeout=self.timeout_minutes * 60 if self.timeout_minutes else None)
-                end = time.time()
-                logger.info(f"Time elapsed: {end - start}")
-                logger.info(f"Successfully converted {len(text)} pages to Markdown")
-
-                if len(text) >= MIN_DOC_TEXT_LENGHT_ACCEPTED:
-                    logger.info(f"Successfully converted {len(text)} text to Markdown")
-                    try_not_markdown = False
-
-            except concurrent.futures.TimeoutError:
-                logger.info(f"Markdown conversion timed out after {self.timeout_minutes} minutes")
-                try_not_markdown = True
-                future.cancel()  # will only cancel if it hasn’t started
-                executor.shutdown(wait=False, cancel_futures=True)
-                executor = None  # avoid shutting down twice
-            except Exception as e:
-                logger.info(f"Markdown conversion failed: {e}")
-                try_not_markdown = True
-            finally:
-                if executor is not None:
-                    executor.shutdown(wait=True)
-
-        if try_not_markdown:
-            # Original plain text extraction
-            logger.info("Not converting file to Markdown")
-            text = ""
-            last_pages_text = ""
-            last_page_index_to_start = 10
-
-            try:
-                for page_number in range(start_page, end_page):
-                    page = pdf_document.load_page(page_number)
-                    page_text = page.get_text("text", flags=16)
-                    page_text = self.clean_text(page_text)
-                    text += page_text
-                    if page_number >= (pdf_document.page_count - last_page_index_to_start):
-                        last_pages_text += page_text
-
-                    # Early termination checks
-                    if len(text) == 0 and page_number == 10:
-                        message = "First 10 pages of the document are empty"
-                        logger.info(message)
-                        raise EmptyDocument(message=message, code=998)
-
-                    if len(text) < MIN_DOC_TEXT_LENGHT_ACCEPTED and page_number == 20:
-                        message = f"First 20 pages of the document have less than {MIN_DOC_TEXT_LENGHT_ACCEPTED} chars"
+            else:
+                try:
+                    pdf_document = fitz.open(temp_file_path)
+                    logger.info(f"Successfully opened file with temp_file_path: {temp_file_path}")
+                except Exception as e:
+                    logger.info("Converting file to PDF")
+                    file_prefix = file_path
+                    temp_file_path = self.convert_doc_to_pdf(file_prefix=file_prefix, input_file=temp_file_path)
+                    pdf_document = fitz.open(temp_file_path)
+
+            total_pages = pdf_document.page_count
+            logger.info(f"Total pages: {total_pages}")
+
+            # Validate and adjust page range
+            start_page, end_page = self.validate_page_range(total_pages)
+
+            try_not_markdown = True
+            if self.markdown_output:
+                # Use pymupdf4llm for markdown conversion
+                logger.info("Converting file to Markdown")
+
+                executor = concurrent.futures.ThreadPoolExecutor(max_workers=1)
+                future = executor.submit(to_markdown, pdf_document, pages=list(range(start_page, end_page)))
+                try:
+                    import time
+                    logger.info(f"Timeout_minutes: {self.timeout_minutes}")
+                    start = time.time()
+                    text = future.result(timeout=self.timeout_minutes * 60 if self.timeout_minutes else None)
+                    end = time.time()
+                    logger.info(f"Time elapsed: {end - start}")
+                    logger.info(f"Successfully converted {len(text)} pages to Markdown")
+
+                    if _BAD_MARKER in text:
+                        logger.info("Using pypdf being strange PDF")
+                        return self.get_document_text_pypdf(file_path=file_path, pdf_data=pdf_data)
+
+                    if len(text) >= MIN_DOC_TEXT_LENGHT_ACCEPTED:
+                        logger.info(f"Successfully converted {len(text)} text to Markdown")
+                        try_not_markdown = False
+
+                except concurrent.futures.TimeoutError:
+                    logger.info(f"Markdown conversion timed out after {self.timeout_minutes} minutes")
+                    try_not_markdown = True
+                    future.cancel()  # will only cancel if it hasn’t started
+                    executor.shutdown(wait=False, cancel_futures=True)
+                    executor = None  # avoid shutting down twice
+                except Exception as e:
+                    logger.info(f"Markdown conversion failed: {e}")
+                    try_not_markdown = True
+                finally:
+                    if executor is not None:
+                        executor.shutdown(wait=True)
+
+            if try_not_markdown:
+                # Original plain text extraction
+                logger.info("Not converting file to Markdown")
+                # Accumulate pages in lists and join once at the end; repeated
+                # `text += page_text` copies the whole document per page. A
+                # running length keeps the size checks O(1).
+                text_parts = []
+                text_len = 0
+                last_page_index_to_start = 10
+                # Row counts are folded in page by page, so the repeated-rows
+                # checks never re-split the accumulated text; hoisting the
+                # range tests keeps the loop free of them when the requested
+                # range excludes the head or tail pages
+                track_head = total_pages >= 500 and start_page <= 10
+                track_tail = total_pages >= 500 and end_page >= total_pages - last_page_index_to_start
+                head_rows = _RowRepeatTracker()
+                tail_rows = _RowRepeatTracker()
+
+                try:
+                    pdf_source = pdf_data if pdf_data is not None else temp_file_path
+                    for page_number, page_text in self._iter_page_texts(pdf_document, pdf_source,
+                                                                        start_page, end_page):
+                        page_text = self.clean_text(page_text)
+                        # Checking the few-KB page here instead of the full
+                        # accumulated text after the loop bails out to pypdf
+                        # on the first corrupt page
+                        if _BAD_MARKER in page_text:
+                            logger.info("Using pypdf being strange PDF")
+                            return self.get_document_text_pypdf(file_path=file_path, pdf_data=pdf_data)
+                        text_parts.append(page_text)
+                        text_len += len(page_text)
+                        if track_head and page_number <= 10:
+                            head_rows.add_page(page_text)
+                        if track_tail and page_number >= (total_pages - last_page_index_to_start):
+                            tail_rows.add_page(page_text)
+
+                        # Early termination checks
+                        if text_len == 0 and page_number == 10:
+                            message = "First 10 pages of the document are empty"
+                            logger.info(message)
+                            raise EmptyDocument(message=message, code=998)
+
+                        if text_len < MIN_DOC_TEXT_LENGHT_ACCEPTED and page_number == 20:
+                            message = f"First 20 pages of the document have less than {MIN_DOC_TEXT_LENGHT_ACCEPTED} chars"
+                            logger.info(message)
+                            raise EmptyDocument(message=message, code=998)
+
+                        if (track_head and
+                                page_number == 10 and
+                                head_rows.exceeds(100)):
+                            message = "First 10 pages of the document have 100 repeated rows"
+                            logger.info(message)
+                            raise EmptyDocument(message=message, code=998)
+
+                        if (track_tail and
+                                (page_number == total_pages - 1) and
+                                tail_rows.exceeds(100)):
+                            message = "Last 10 pages of the document have 100 repeated rows"
+                            logger.info(message)
+                            raise EmptyDocument(message=message, code=998)
+
+                    # Validate on the running counter so failure paths never
+                    # materialize the joined text
+                    if text_len == 0:
+                        message = "No text detected"
                         logger.info(message)
                         raise EmptyDocument(message=message, code=998)
 
-                    if (total_pages >= 500 and
-                            page_number == 10 and
-                            self.has_repeated_rows(text=text, threshold=100)):
-                        message = "First 10 pages of the document have 100 repeated rows"
-                        logger.info(message)
-                        raise EmptyDocument(message=message, code=998)
+                    text = "".join(text_parts)
 
-                    if (total_pages >= 500 and
-                            (page_number == total_pages - 1) and
-                            self.has_repeated_rows(text=last_pages_text, threshold=100)):
-                        message = "Last 10 pages of the document have 100 repeated rows"
-                        logger.info(message)
+                    if text_len < MIN_DOC_TEXT_LENGHT_ACCEPTED:
+                        logger.info(f"TEXT: {text}")
+                        message = f"Document text with less than {MIN_DOC_TEXT_LENGHT_ACCEPTED} characters"
                         raise EmptyDocument(message=message, code=998)
-            except EmptyDocument as e:
-                raise e
-            except Exception as e:
-                logger.info(f"Error during text extraction: {e}")
-                raise LoaderError(message="text extraction error", status=422, code="TEXT EXTRACTION ERROR")
+                except EmptyDocument as e:
+                    raise e
+                except Exception as e:
+                    logger.info(f"Error during text extraction: {e}")
+                    raise LoaderError(message="text extraction error", status=422, code="TEXT EXTRACTION ERROR")
 
 
-        pdf_document.close()
-        if self.source == "cloud":
-            os.remove(temp_file_path)
-
-        if len(text) == 0:
-            message = "No text detected"
-            logger.info(message)
-            raise EmptyDocument(message=message, code=998)
-
-        if "������������������������������������������" in text:
-            logger.info("Using pypdf being strange PDF")
-            return self.get_document_text_pypdf(file_path=file_path)
-
-        if len(text) < MIN_DOC_TEXT_LENGHT_ACCEPTED:
-            logger.info(f"TEXT: {text}")
-            message = f"Document text with less than {MIN_DOC_TEXT_LENGHT_ACCEPTED} characters"
-            raise EmptyDocument(message=message, code=998)
+        finally:
+            if pdf_document is not None:
+                pdf_document.close()
+            if self.source == "cloud" and temp_file_path is not None and os.path.exists(temp_file_path):
+                os.remove(temp_file_path)
 
         result_dict = {
             "text": text,
@@ -336,13 +586,14 @@ class DocumentLoader:
 
         return result_dict
 
-    def get_document_text_pypdf(self, file_path: str) -> dict:
+    def get_document_text_pypdf(self, file_path: str, pdf_data: bytes = None) -> dict:
         """
         Extract text from a document using PyPDF as fallback extraction backend.
 
         Alternative to get_document_text that uses PyPDF when PyMuPDF fails.
         Downloads from cloud storage if needed, converts non-PDF files, and
-        performs quality validation on extracted text.
+        performs quality validation on extracted text. Callers that already
+        hold the document bytes can pass them to skip a second download.
 
         Args:
             file_path (str): Path to document file (local path or cloud URI)
@@ -366,156 +617,254 @@ class DocumentLoader:
         """
         logger.info("Using PyPDF")
 
+        temp_file_path = None
         if self.source == "cloud":
-            fd, temp_file_path = tempfile.mkstemp()
-            try:
-                temp_file_path = self.download_document(file_path, temp_file_path)
-                logger.info(f"Successfully loaded document from {file_path}")
-            finally:
-                os.close(fd)
+            # The MarkItDown branch needs a filename on disk, so in-memory
+            # loading is only worthwhile when it is skipped
+            needs_file = self.markdown_output and self.page_range is None
+            if pdf_data is not None and needs_file:
+                # Spill the caller's bytes to disk instead of re-downloading
+                fd, temp_file_path = tempfile.mkstemp(suffix=".pdf")
+                with os.fdopen(fd, "wb") as f:
+                    f.write(pdf_data)
+                pdf_data = None
+            elif pdf_data is None:
+                if os.path.splitext(file_path)[1].lower() == ".pdf" and not needs_file:
+                    pdf_data = self._download_document_bytes(file_path)
+                    logger.info(f"Successfully loaded document from {file_path}")
+                else:
+                    fd, temp_file_path = tempfile.mkstemp(suffix=os.path.splitext(file_path)[1])
+                    try:
+                        temp_file_path = self.download_document(file_path, temp_file_path)
+                        logger.info(f"Successfully loaded document from {file_path}")
+                    finally:
+                        os.close(fd)
         elif self.source == "local":
             temp_file_path = file_path
             logger.info(f"Successfully loaded document from local path {file_path}")
         else:
             raise ValueError("Invalid OCR source. Choose 'cloud' or 'local'.")
 
-        # Handle PDF conversion and opening
-        if os.path.splitext(file_path)[1].lower() != ".pdf":
-            logger.info("Converting file to PDF")
-            file_prefix = file_path
-            temp_file_path = self.convert_doc_to_pdf(file_prefix=file_prefix, input_file=temp_file_path)
-            logger.debug(f"temp_file_path post conversion to pdf: {temp_file_path}")
-            file = open(temp_file_path, "rb")
-            pdf_reader = PdfReader(file)
-        else:
-            try:
-                file = open(temp_file_path, "rb")
-                pdf_reader = PdfReader(file)
-                logger.info(f"Successfully opened file with temp_file_path: {temp_file_path}")
-            except Exception as e:
+        try:
+            # Handle PDF conversion and opening
+            if pdf_data is not None:
+                try:
+                    pdf_reader = PdfReader(io.BytesIO(pdf_data))
+                    logger.info("Successfully opened in-memory document")
+                except Exception as e:
+                    logger.info("Converting file to PDF")
+                    fd, temp_file_path = tempfile.mkstemp(suffix=".pdf")
+                    with os.fdopen(fd, "wb") as f:
+                        f.write(pdf_data)
+                    pdf_data = None
+                    temp_file_path = self.convert_doc_to_pdf(file_prefix=file_path, input_file=temp_file_path)
+                    logger.debug(f"temp_file_path post conversion to pdf: {temp_file_path}")
+                    pdf_reader = self._open_pdf_reader(temp_file_path)
+            elif os.path.splitext(file_path)[1].lower() != ".pdf":
                 logger.info("Converting file to PDF")
                 file_prefix = file_path
                 temp_file_path = self.convert_doc_to_pdf(file_prefix=file_prefix, input_file=temp_file_path)
                 logger.debug(f"temp_file_path post conversion to pdf: {temp_file_path}")
-                file = open(temp_file_path, "rb")
-                pdf_reader = PdfReader(file)
-
-        total_pages = len(pdf_reader.pages)
+                pdf_reader = self._open_pdf_reader(temp_file_path)
+            else:
+                try:
+                    pdf_reader = self._open_pdf_reader(temp_file_path)
+                    logger.info(f"Successfully opened file with temp_file_path: {temp_file_path}")
+                except Exception as e:
+                    logger.info("Converting file to PDF")
+                    file_prefix = file_path
+                    temp_file_path = self.convert_doc_to_pdf(file_prefix=file_prefix, input_file=temp_file_path)
+                    logger.debug(f"temp_file_path post conversion to pdf: {temp_file_path}")
+                    pdf_reader = self._open_pdf_reader(temp_file_path)
+
+            total_pages = len(pdf_reader.pages)
+
+            # Validate and adjust page range
+            start_page, end_page = self.validate_page_range(total_pages)
 
-        # Validate and adjust page range
-        start_page, end_page = self.validate_page_range(total_pages)
+            text = ""
+            try_not_markdown = True
+            if self.markdown_output and self.page_range is None: # and self.page_range is None:
+                # Use markitdown for markdown conversion
+                logger.info("Converting file to Markdown with Markitdown")
+
+                def convert_to_markdown(path):
+                    md = MarkItDown()
+                    return md.convert(path).markdown
+
+                executor = concurrent.futures.ThreadPoolExecutor(max_workers=1)
+                future = executor.submit(convert_to_markdown, temp_file_path)
+                try:
+                    text = future.result(timeout=self.timeout_minutes * 60 if self.timeout_minutes else None)
+
+                    if len(text) >= MIN_DOC_TEXT_LENGHT_ACCEPTED:
+                        try_not_markdown = False
+
+                except concurrent.futures.TimeoutError:
+                    logger.info(f"Markdown conversion timed out after {self.timeout_minutes} minutes")
+                    try_not_markdown = True
+                    future.cancel()  # cancels only if not started yet
+                    executor.shutdown(wait=False, cancel_futures=True)
+                    executor = None
+
+                except Exception as e:
+                    logger.info(f"Markdown conversion failed: {e}")
+                    try_not_markdown = True
+
+                finally:
+                    if executor is not None:
+                        executor.shutdown(wait=True)
+
+            if try_not_markdown:
+                try:
+                    # Original plain text extraction logic
+                    logger.info("Fallback without Markdown conversion")
+                    # Same list-and-join accumulation and incremental row
+                    # tracking as get_document_text
+                    text_parts = []
+                    text_len = 0
+                    last_page_index_to_start = 10
+                    track_head = total_pages >= 500 and start_page <= 10
+                    track_tail = total_pages >= 500 and end_page >= total_pages - last_page_index_to_start
+                    head_rows = _RowRepeatTracker()
+                    tail_rows = _RowRepeatTracker()
+
+                    for page_number in range(start_page, end_page):
+                        page = pdf_reader.pages[page_number]
+                        page_text = page.extract_text()
+                        page_text = self.clean_text(page_text)
+                        text_parts.append(page_text)
+                        text_len += len(page_text)
+
+                        if track_head and page.page_number <= 10:
+                            head_rows.add_page(page_text)
+                        if track_tail and page.page_number >= (total_pages - last_page_index_to_start):
+                            tail_rows.add_page(page_text)
+
+                        # Early termination checks
+                        if text_len == 0 and page.page_number == 10:
+                            message = "First 10 pages of the document are empty"
+                            logger.info(message)
+                            raise EmptyDocument(message=message, code=998)
+                        if text_len < MIN_DOC_TEXT_LENGHT_ACCEPTED and page.page_number == 20:
+                            message = f"First 20 pages of the document have less than {MIN_DOC_TEXT_LENGHT_ACCEPTED} chars"
+                            logger.info(message)
+                            raise EmptyDocument(message=message, code=998)
+                        if (
+                                track_head
+                                and page.page_number == 10
+                                and head_rows.exceeds(100)
+                        ):
+                            message = "First 10 pages of the document have 100 repeated rows"
+                            logger.info(message)
+                            raise EmptyDocument(message=message, code=998)
+                        if (
+                                track_tail
+                                and (page.page_number == total_pages - 1)
+                                and tail_rows.exceeds(100)
+                        ):
+                            message = "Last 10 pages of the document have 100 repeated rows"
+                            logger.info(message)
+                            raise EmptyDocument(message=message, code=998)
+
+                    text = "".join(text_parts)
+                except EmptyDocument as e:
+                    raise e
+                except Exception as e:
+                    logger.info(f"Error during text extraction: {e}")
+                    raise LoaderError(message="text extraction error", status=422, code="TEXT EXTRACTION ERROR")
+
+            if len(text) == 0:
+                message = "No text detected"
+                logger.info(message)
+                raise EmptyDocument(message=message, code=998)
+
+            if len(text) < MIN_DOC_TEXT_LENGHT_ACCEPTED:
+                message = f"Document text with less than {MIN_DOC_TEXT_LENGHT_ACCEPTED} characters"
+                raise EmptyDocument(message=message, code=998)
+
+            result_dict = {
+                "text": text,
+                "completion_tokens": 0,
+                "prompt_tokens": 0,
+                "completion_model": "not provided",
+                "completion_model_provider": "not provided",
+                "text_chunks": "not provided",
+                "type": self.type,
+                "input": file_path,
+            }
+
+            return result_dict
+        finally:
+            if self.source == "cloud" and temp_file_path is not None and os.path.exists(temp_file_path):
+                os.remove(temp_file_path)
 
-        text = ""
-        try_not_markdown = True
-        if self.markdown_output and self.page_range is None: # and self.page_range is None:
-            # Use markitdown for markdown conversion
-            logger.info("Converting file to Markdown with Markitdown")
+    # Helper methods
 
-            def convert_to_markdown(path):
-                md = MarkItDown()
-                return md.convert(path).markdown
+    @staticmethod
+    def _iter_page_texts(pdf_document, pdf_source, start_page: int, end_page: int):
+        """
+        Yield (page_number, raw_text) for a page range, in page order.
 
-            executor = concurrent.futures.ThreadPoolExecutor(max_workers=1)
-            future = executor.submit(convert_to_markdown, temp_file_path)
-            try:
-                text = future.result(timeout=self.timeout_minutes * 60 if self.timeout_minutes else None)
+        Long documents fan the CPU-bound PyMuPDF text extraction out to a
+        process pool (each worker opens the PDF once); short ones stay
+        in-process, where the pool startup would cost more than it saves.
+        Results are re-ordered on the fly, so callers can keep their
+        incremental quality checks; abandoning the iterator early (e.g.
+        when a check raises) tears the pool down with it.
 
-                if len(text) >= MIN_DOC_TEXT_LENGHT_ACCEPTED:
-                    try_not_markdown = False
+        Args:
+            pdf_document: Open fitz document, used for the sequential path.
+            pdf_source (str | bytes): Path to the PDF, or its raw bytes for
+                in-memory documents; either way, reopened by pool workers.
+            start_page (int): First page to extract (0-indexed, inclusive).
+            end_page (int): Last page to extract (exclusive).
+
+        Yields:
+            tuple[int, str]: Page number and its extracted text.
+        """
+        if end_page - start_page >= PAGE_EXTRACTION_MIN_PAGES and PAGE_EXTRACTION_WORKERS > 1:
+            with multiprocessing.Pool(processes=PAGE_EXTRACTION_WORKERS,
+                                      initializer=_init_page_worker,
+                                      initargs=(pdf_source,)) as pool:
+                pending = {}
+                next_page = start_page
+                for page_number, page_text in pool.imap_unordered(
+                        _extract_page, range(start_page, end_page), chunksize=8):
+                    pending[page_number] = page_text
+                    while next_page in pending:
+                        yield next_page, pending.pop(next_page)
+                        next_page += 1
+            return
+
+        # The C-level pages() iterator walks the range without a load_page
+        # call (and its Python-side lookup) per page
+        for page_number, page in enumerate(pdf_document.pages(start_page, end_page), start=start_page):
+            yield page_number, page.get_text("text", flags=TEXT_EXTRACTION_FLAGS)
 
-            except concurrent.futures.TimeoutError:
-                logger.info(f"Markdown conversion timed out after {self.timeout_minutes} minutes")
-                try_not_markdown = True
-                future.cancel()  # cancels only if not started yet
-                executor.shutdown(wait=False, cancel_futures=True)
-                executor = None
+    @staticmethod
+    def _open_pdf_reader(temp_file_path: str) -> PdfReader:
+        """
+        Open a PdfReader backed by a read-only memory map of the file.
 
-            except Exception as e:
-                logger.info(f"Markdown conversion failed: {e}")
-                try_not_markdown = True
+        pypdf issues many small seek/read calls while resolving objects;
+        serving them from the page cache via mmap avoids a buffered-IO
+        syscall per read and a second in-memory copy of the document.
+        Files that cannot be mapped (e.g. empty ones) fall back to a
+        regular file handle.
 
-            finally:
-                if executor is not None:
-                    executor.shutdown(wait=True)
+        Args:
+            temp_file_path (str): Path to the PDF file to open.
 
-        if try_not_markdown:
+        Returns:
+            PdfReader: Reader over the mapped (or plain) file bytes.
+        """
+        with open(temp_file_path, "rb") as file:
             try:
-                # Original plain text extraction logic
-                logger.info("Fallback without Markdown conversion")
-                text = ""
-                last_pages_text = ""
-                last_page_index_to_start = 10
-
-                for page_number in range(start_page, end_page):
-                    page = pdf_reader.pages[page_number]
-                    page_text = page.extract_text()
-                    page_text = self.clean_text(page_text)
-                    text += page_text
-
-                    if page.page_number >= (total_pages - last_page_index_to_start):
-                        last_pages_text += page_text
-
-                    # Early termination checks
-                    if len(text) == 0 and page.page_number == 10:
-                        message = "First 10 pages of the document are empty"
-                        logger.info(message)
-                        os.remove(temp_file_path)
-                        raise EmptyDocument(message=message, code=998)
-                    if len(text) < MIN_DOC_TEXT_LENGHT_ACCEPTED and page.page_number == 20:
-                        message = f"First 20 pages of the document have less than {MIN_DOC_TEXT_LENGHT_ACCEPTED} chars"
-                        logger.info(message)
-                        os.remove(temp_file_path)
-                        raise EmptyDocument(message=message, code=998)
-                    if (
-                            total_pages >= 500
-                            and page.page_number == 10
-                            and self.has_repeated_rows(text=text, threshold=100)
-                    ):
-                        message = "First 10 pages of the document have 100 repeated rows"
-                        logger.info(message)
-                        os.remove(temp_file_path)
-                        raise EmptyDocument(message=message, code=998)
-                    if (
-                            total_pages >= 500
-                            and (page.page_number == total_pages - 1)
-                            and self.has_repeated_rows(text=last_pages_text, threshold=100)
-                    ):
-                        message = "Last 10 pages of the document have 100 repeated rows"
-                        logger.info(message)
-                        os.remove(temp_file_path)
-                        raise EmptyDocument(message=message, code=998)
-            except EmptyDocument as e:
-                raise e
-            except Exception as e:
-                logger.info(f"Error during text extraction: {e}")
-                raise LoaderError(message="text extraction error", status=422, code="TEXT EXTRACTION ERROR")
-
-        if len(text) == 0:
-            message = "No text detected"
-            logger.info(message)
-            raise EmptyDocument(message=message, code=998)
-
-        if len(text) < MIN_DOC_TEXT_LENGHT_ACCEPTED:
-            message = f"Document text with less than {MIN_DOC_TEXT_LENGHT_ACCEPTED} characters"
-            raise EmptyDocument(message=message, code=998)
-
-        if self.source == "cloud":
-            os.remove(temp_file_path)
-
-        result_dict = {
-            "text": text,
-            "completion_tokens": 0,
-            "prompt_tokens": 0,
-            "completion_model": "not provided",
-            "completion_model_provider": "not provided",
-            "text_chunks": "not provided",
-            "type": self.type,
-            "input": file_path,
-        }
-
-        return result_dict
-
-    # Helper methods
+                mapped = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+            except (ValueError, OSError):
+                return PdfReader(open(temp_file_path, "rb"))
+        return PdfReader(mapped)
 
     def validate_page_range(self, total_pages: int) -> tuple[int, int]:
         """
@@ -542,6 +891,13 @@ class DocumentLoader:
                 )
             start_page = max(0, self.page_range[0] - 1)  # Convert to 0-indexed
             end_page = min(self.page_range[1], total_pages)
+            # Fail fast on an empty range instead of running the whole
+            # extraction pipeline just to find no text
+            if end_page <= start_page:
+                raise ExceededMaxPages(
+                    message=f"Requested page range {self.page_range} selects no pages",
+                    code=998
+                )
         else:
             start_page = 0
             end_page = total_pages
@@ -565,9 +921,12 @@ class DocumentLoader:
             str: Cleaned and normalized text
         """
         if text:
-            text = text.replace('"', "'")
-            text = re.sub(r"\n\s*\n", "\n", text)
-            text = text.replace('<|endoftext|>', '')
+            text = text.translate(_CLEAN_TRANS)
+            text = _BLANK_LINE_RE.sub("\n", text)
+            # Membership test first: replace() always allocates and scans,
+            # while the sentinel is almost never present
+            if '<|endoftext|>' in text:
+                text = text.replace('<|endoftext|>', '')
         return text
 
     @staticmethod
@@ -620,7 +979,7 @@ class DocumentLoader:
             return True
 
         # Count the number of valid (alphanumeric) characters
-        valid_chars = sum(c.isalnum() for c in sample_text)
+        valid_chars = len(_ALNUM_RE.findall(sample_text))
 
         # Determine the percentage of valid characters in the sample
         valid_percentage = valid_chars / len(sample_text)
@@ -1,12 +1,12 @@
 # Standard library imports
-import requests
+import asyncio
 
 # Local imports
-from ..converter import md_to_text, html_to_md
+from ..converter import md_to_text, html_to_md, html_string_to_md
 from ..exceptions.base import EmptyDocument
 
 # External imports
-from retry import retry
+import httpx
 
 
 class HtmlLoader:
@@ -25,11 +25,11 @@ class HtmlLoader:
         self.markdown_output = markdown_output
         self.type = "url"
 
-    @retry(requests.exceptions.RequestException, tries=5, delay=2, backoff=2)
     def get_text_from_url(self, url: str) -> dict:
         """
         Retrieves the HTML content, converts it to Markdown, and optionally to plain text.
-        Handles request failures with retry and a final try-except block.
+        Transient request failures are retried at the transport level by the
+        shared session in the converter.
 
         Args:
             url (str): The URL of the HTML page to fetch.
@@ -46,6 +46,38 @@ class HtmlLoader:
 
         return result_dict
 
+    async def aload(self, urls: list[str]) -> list[dict]:
+        """
+        Fetch several web pages concurrently and convert each to Markdown
+        (or plain text, depending on `markdown_output`).
+
+        Fetches share one async HTTP client with pooled connections; the
+        CPU-bound Markdown conversion runs in worker threads so it does not
+        block the event loop.
+
+        Args:
+            urls (list[str]): The URLs of the HTML pages to fetch.
+
+        Returns:
+            list[dict]: One extraction result per URL, in input order.
+        """
+        limits = httpx.Limits(max_connections=32)
+        async with httpx.AsyncClient(follow_redirects=True, timeout=20, limits=limits) as client:
+            responses = await asyncio.gather(*[client.get(url) for url in urls])
+
+        for response in responses:
+            response.raise_for_status()
+
+        result_dicts = await asyncio.gather(
+            *[asyncio.to_thread(html_string_to_md, response.text) for response in responses]
+        )
+        for url, result_dict in zip(urls, result_dicts):
+            result_dict["type"] = self.type
+            result_dict["input"] = url
+            if not self.markdown_output:
+                result_dict["text"] = md_to_text(result_dict["text"])
+        return list(result_dicts)
+
     def load(self, input_path: str) -> dict:
         """
         Extract text content from a web page URL.
@@ -1,13 +1,19 @@
 # ocr.py
 # Standard library imports
 import os
+import asyncio
 import tempfile
 import logging
+import itertools
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 
 # Local imports
 from ..converter.ocr_to_text import get_ocr
 from ..loader.downloader.downloader import Downloader
 from ..exceptions import EmptyDocument
+from ._result_cache import result_cache_path, load_cached_result, store_cached_result
 
 logger = logging.getLogger(__name__)
 
@@ -26,6 +32,7 @@ class OCRLoader:
                  target_size: int = 1,
                  timeout_minutes: int = None,
                  include_image_descriptions: bool = False,
+                 cache_enabled: bool = False,
                  **kwargs
                  ):
         """
@@ -50,6 +57,9 @@ class OCRLoader:
             include_image_descriptions (bool, optional): If True, OCR prompts include
                 brief functional descriptions for meaningful non-text images.
                 Defaults to False.
+            cache_enabled (bool, optional): If True, OCR results are cached
+                on disk keyed by file content hash, so repeated documents skip
+                the LLM call. Defaults to False.
             **kwargs:
                 ocr_model (str, optional): Explicit Gemini OCR model to pass through to the converter.
                 max_output_tokens (int, optional): Maximum Gemini output tokens for OCR generation.
@@ -69,6 +79,7 @@ class OCRLoader:
         self.type = "image"
         self.timeout_minutes = timeout_minutes
         self.include_image_descriptions = include_image_descriptions
+        self.cache_enabled = cache_enabled
         requested_ocr_model = kwargs.get("ocr_model")
         self.ocr_model = (
             requested_ocr_model
@@ -77,10 +88,23 @@ class OCRLoader:
         )
         self.max_output_tokens = kwargs.get("max_output_tokens")
 
-        # Set up custom temp directory
+        # Set up custom temp directory; passed explicitly to every temp-file
+        # site rather than mutating the process-wide tempfile.tempdir
         self.temp_dir = os.path.abspath(temp_dir)
         os.makedirs(self.temp_dir, exist_ok=True)
-        tempfile.tempdir = self.temp_dir
+
+        # One Downloader per loader; the wrapped storage client (and its
+        # connection pool) is then shared across every download this
+        # instance performs
+        if s3_client is not None:
+            self._downloader = Downloader(s3_client=s3_client, document_aws_bucket=document_aws_bucket)
+            self._download_impl = self._downloader.download_file_from_s3
+        elif gcs_client is not None:
+            self._downloader = Downloader(gcs_client=gcs_client, document_gcs_bucket=document_gcs_bucket)
+            self._download_impl = self._downloader.download_file_from_gcs
+        else:
+            self._downloader = None
+            self._download_impl = None
 
     def download_document(self, file_path, temp_file_path):
         """
@@ -96,14 +120,8 @@ class OCRLoader:
         Raises:
             ClientError: If download operation fails
         """
-        if self.s3_client is not None:
-            downloader = Downloader(s3_client=self.s3_client, document_aws_bucket=self.document_aws_bucket)
-            downloader.download_file_from_s3(file_path, temp_file_path)
-            logger.info(f'Downloaded {file_path} to {temp_file_path}')
-            return temp_file_path
-        elif self.gcs_client is not None:
-            downloader = Downloader(gcs_client=self.gcs_client, document_gcs_bucket=self.document_gcs_bucket)
-            downloader.download_file_from_gcs(file_path, temp_file_path)
+        if self._download_impl is not None:
+            self._download_impl(file_path, temp_file_path)
             logger.info(f'Downloaded {file_path} to {temp_file_path}')
             return temp_file_path
 
@@ -126,44 +144,180 @@ class OCRLoader:
         """
         logger.info("Starting text extraction using OCR...")
 
-        # Load or download the document file
-        if self.source == "cloud":
-            fd, temp_file_path = tempfile.mkstemp()
-            try:
-                fd, temp_file = tempfile.mkstemp()
-                temp_file_path = self.download_document(file_path, temp_file)
-                logger.info(f"Successfully loaded document from {file_path}")
-            finally:
-                os.close(fd)  # Close the file descriptor
-        elif self.source == "local":
-            temp_file_path = file_path  # For local files, use the path directly
-            logger.info(f"Successfully loaded document from local path {file_path}")
-        else:
+        handler = self._SOURCE_HANDLERS.get(self.source)
+        if handler is None:
             raise ValueError("Invalid OCR source. Choose 'cloud' or 'local'.")
+        with handler(self, file_path) as temp_file_path:
+            return self._extract_from_local_file(file_path, temp_file_path)
+
+    def get_text_from_local_ocr(self, file_path):
+        """
+        Extract text from a local file, skipping source dispatch entirely.
+
+        Thin fast path for callers that know the file is on disk: no source
+        lookup, no temp-file context, straight into the (possibly cached)
+        OCR call.
+
+        Args:
+            file_path (str): Path to the local image file.
+
+        Returns:
+            dict: Dictionary containing the OCR results and metadata.
+        """
+        return self._extract_from_local_file(file_path, file_path)
+
+    @contextmanager
+    def _handle_cloud(self, file_path):
+        """Yield a local copy of a cloud document, deleting it on exit."""
+        temp_file = self._download_to_temp_file(file_path)
+        try:
+            yield temp_file.name
+        finally:
+            # Closing the handle deletes the downloaded file
+            temp_file.close()
+            logger.info(f"Removed temporary file {temp_file.name}")
+
+    @contextmanager
+    def _handle_local(self, file_path):
+        """Yield a local file path directly; nothing to download or clean up."""
+        logger.info(f"Successfully loaded document from local path {file_path}")
+        yield file_path
+
+    # Source dispatch resolved once per call instead of chained comparisons
+    _SOURCE_HANDLERS = {"cloud": _handle_cloud, "local": _handle_local}
+
+    def _download_to_temp_file(self, file_path):
+        """
+        Download a cloud document into a NamedTemporaryFile that owns both
+        the descriptor and the on-disk cleanup.
+
+        Args:
+            file_path (str): Path to the document in S3 or GCS.
+
+        Returns:
+            tempfile.NamedTemporaryFile: Handle whose .name holds the bytes;
+                closing it deletes the file.
+        """
+        temp_file = tempfile.NamedTemporaryFile(suffix=os.path.splitext(file_path)[1], dir=self.temp_dir)
+        try:
+            self.download_document(file_path, temp_file.name)
+        except BaseException:
+            temp_file.close()
+            raise
+        logger.info(f"Successfully loaded document from {file_path}")
+        return temp_file
+
+    def _extract_from_local_file(self, file_path, temp_file_path):
+        """
+        Run (possibly cached) OCR on a local file and finalize the result.
+
+        Args:
+            file_path (str): Original input path, recorded in the result.
+            temp_file_path (str): Local path holding the file bytes.
+
+        Returns:
+            dict: Dictionary containing the OCR results and metadata.
 
-        result_dict = get_ocr(file_for_ocr=temp_file_path,
-                              markdown_output=self.markdown_output,
-                              llm_api_key=self.llm_api_key,
-                              target_size=self.target_size,
-                              timeout_minutes=self.timeout_minutes,
-                              ocr_model=self.ocr_model,
-                              max_output_tokens=self.max_output_tokens,
-                              include_image_descriptions=self.include_image_descriptions)
+        Raises:
+            EmptyDocument: If no text could be extracted.
+        """
+        # Repeated content with the same settings is served from the
+        # on-disk cache instead of paying the LLM OCR call again
+        cache_path = None
+        result_dict = None
+        if self.cache_enabled:
+            cache_path = result_cache_path(
+                self.temp_dir, temp_file_path,
+                int(self.markdown_output), self.ocr_model or 'default',
+                int(self.include_image_descriptions),
+            )
+            result_dict = load_cached_result(cache_path)
+            if result_dict is not None:
+                logger.info(f"OCR cache hit for {file_path}")
+
+        if result_dict is None:
+            result_dict = get_ocr(file_for_ocr=temp_file_path,
+                                  markdown_output=self.markdown_output,
+                                  llm_api_key=self.llm_api_key,
+                                  target_size=self.target_size,
+                                  timeout_minutes=self.timeout_minutes,
+                                  ocr_model=self.ocr_model,
+                                  max_output_tokens=self.max_output_tokens,
+                                  include_image_descriptions=self.include_image_descriptions)
+            if cache_path is not None:
+                store_cached_result(cache_path, result_dict)
 
         result_dict["type"] = self.type
         result_dict["input"] = file_path
 
-        # Clean up temporary file if it was downloaded
-        if self.source == "cloud":
-            if os.path.exists(temp_file_path):
-                os.remove(temp_file_path)
-                logger.info(f"Removed temporary file {temp_file_path}")
-
         if len(result_dict["text"].strip()) == 0:
             raise EmptyDocument(f"No text extracted from {file_path}. The file may be empty or not contain any transcribable content.")
 
         return result_dict
 
+    def iter_texts_from_ocr(self, file_paths, prefetch: int = 4):
+        """
+        Yield OCR results for a batch of documents, in input order.
+
+        While document N is being OCR'd, up to `prefetch` subsequent
+        documents are already being downloaded in background threads, so
+        the storage-bound and LLM-bound stages overlap instead of running
+        back to back. The bounded prefetch window keeps at most `prefetch`
+        downloaded files on disk at a time.
+
+        Args:
+            file_paths (list): Paths to the documents to process.
+            prefetch (int, optional): Number of downloads to run ahead of
+                OCR. Defaults to 4.
+
+        Yields:
+            dict: Dictionary containing the OCR results and metadata, one
+                per input path.
+        """
+        if self.source != "cloud":
+            for file_path in file_paths:
+                yield self.get_text_from_ocr(file_path)
+            return
+
+        paths = iter(file_paths)
+        with ThreadPoolExecutor(max_workers=prefetch) as executor:
+            pending = deque(
+                (file_path, executor.submit(self._download_to_temp_file, file_path))
+                for file_path in itertools.islice(paths, prefetch)
+            )
+            while pending:
+                file_path, future = pending.popleft()
+                temp_file = future.result()
+                for next_path in itertools.islice(paths, 1):
+                    pending.append((next_path, executor.submit(self._download_to_temp_file, next_path)))
+                try:
+                    yield self._extract_from_local_file(file_path, temp_file.name)
+                finally:
+                    temp_file.close()
+
+    def get_texts_from_ocr(self, file_paths, max_workers: int = 8):
+        """
+        Extract text from several documents concurrently, in input order.
+
+        The per-image OCR call is dominated by the Gemini round trip, so a
+        batch of N sequential calls pays roughly N network latencies; fanning
+        them out over a thread pool pays about one. Synchronous counterpart
+        of aload for callers without an event loop.
+
+        Args:
+            file_paths (list): Paths to the documents to process.
+            max_workers (int, optional): Maximum OCR calls in flight.
+                Defaults to 8.
+
+        Returns:
+            list[dict]: One OCR result per input path, in input order.
+        """
+        if not file_paths:
+            return []
+
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(file_paths))) as executor:
+            return list(executor.map(self.get_text_from_ocr, file_paths))
+
     def load(self, input_path: str) -> dict:
         """
         Load and extract text content from ocr file.
@@ -175,3 +329,28 @@ class OCRLoader:
             dict: A dictionary containing the extracted text and related metadata.
         """
         return self.get_text_from_ocr(file_path=input_path)
+
+    async def aload(self, input_paths: list, max_concurrency: int = 8) -> list[dict]:
+        """
+        Extract text from several documents concurrently from an event loop.
+
+        Each document runs the blocking download+OCR pipeline in a worker
+        thread, so an async service can keep serving requests while many
+        documents are in flight. A semaphore bounds in-flight extractions
+        so memory use stays predictable.
+
+        Args:
+            input_paths (list): Paths to the documents to process.
+            max_concurrency (int, optional): Maximum extractions in flight.
+                Defaults to 8.
+
+        Returns:
+            list[dict]: One OCR result per input path, in input order.
+        """
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def extract(file_path):
+            async with semaphore:
+                return await asyncio.to_thread(self.get_text_from_ocr, file_path)
+
+        return list(await asyncio.gather(*[extract(file_path) for file_path in input_paths]))
@@ -1,16 +1,92 @@
 # video.py
 # Standard library imports
 import os
-import tempfile
+import queue
+import asyncio
+import shutil
 import logging
+import itertools
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 
 # Local imports
 from ..loader.downloader.downloader import Downloader
-from ..converter.video_to_audio import convert_video_to_audio
+from ._tempfile_pool import get_temp_file_pool
+from ._result_cache import result_cache_path, load_cached_result, store_cached_result
+from ..converter.video_to_audio import convert_video_to_audio, convert_video_stream_to_audio
 from ..converter.audio_to_text import transcribe_full_audio
 
+# External imports
+import ffmpeg
+
 logger = logging.getLogger(__name__)
 
+# Read-ahead sizing for streamed cloud video: enough queued chunks to hide
+# one ranged-GET round trip behind the transcode without holding more than a
+# few MB in memory
+_PREFETCH_CHUNK_SIZE = 1 << 20
+_PREFETCH_CHUNKS = 4
+
+
+class _PrefetchStream:
+    """
+    File-like wrapper that reads ahead of its consumer in a background thread.
+
+    Cloud blob readers fetch on demand, so without read-ahead the ffmpeg
+    pipe feed alternates between waiting on the network and waiting on the
+    encoder. A producer thread keeps a bounded queue of chunks filled while
+    the consumer drains the previous one, overlapping the two stages.
+    """
+
+    def __init__(self, raw, chunk_size: int = _PREFETCH_CHUNK_SIZE, prefetch_chunks: int = _PREFETCH_CHUNKS):
+        self._raw = raw
+        self._queue = queue.Queue(maxsize=prefetch_chunks)
+        self._buffer = b""
+        self._eof = False
+        self._closed = False
+        self._thread = threading.Thread(target=self._fill, args=(chunk_size,), daemon=True)
+        self._thread.start()
+
+    def _fill(self, chunk_size: int) -> None:
+        try:
+            while not self._closed:
+                chunk = self._raw.read(chunk_size)
+                self._queue.put(chunk)
+                if not chunk:
+                    return
+        except Exception as exc:  # propagated to the consumer on read()
+            self._queue.put(exc)
+
+    def read(self, size: int = -1) -> bytes:
+        while not self._eof and (size < 0 or len(self._buffer) < size):
+            item = self._queue.get()
+            if isinstance(item, Exception):
+                self._eof = True
+                raise item
+            if not item:
+                self._eof = True
+                break
+            self._buffer += item
+        if size < 0:
+            result, self._buffer = self._buffer, b""
+        else:
+            result, self._buffer = self._buffer[:size], self._buffer[size:]
+        return result
+
+    def close(self) -> None:
+        self._closed = True
+        # Unblock a producer waiting on a full queue, then release the
+        # underlying handle
+        while True:
+            try:
+                self._queue.get_nowait()
+            except queue.Empty:
+                break
+        self._thread.join(timeout=5)
+        self._raw.close()
+
+
 class VideoLoader:
 
     def __init__(
@@ -26,6 +102,7 @@ class VideoLoader:
             markdown_output: bool =True,
             bitrate_quality: int =9,
             timeout_minutes: int = None,
+            cache_enabled: bool = False,
             **kwargs
     ) -> None:
         """
@@ -43,6 +120,9 @@ class VideoLoader:
             temp_dir (str, optional): Path for temporary file storage. Defaults to "temp".
             bitrate_quality (int, optional): Variable bitrate quality from 0-9 (9 being lowest). Defaults to 9.
             timeout_minutes (int, optional): Timeout in minutes. Defaults to None.
+            cache_enabled (bool, optional): If True, transcription results are
+                cached on disk keyed by the extracted audio's content hash, so
+                repeated videos skip the STT call. Defaults to False.
 
         Raises:
             ValueError: If cloud storage clients are provided without bucket names
@@ -59,11 +139,25 @@ class VideoLoader:
         self.type = "video"
         self.bitrate_quality = bitrate_quality
         self.timeout_minutes = timeout_minutes
+        self.cache_enabled = cache_enabled
 
-        # Set up custom temp directory
+        # Set up custom temp directory; passed explicitly to every temp-file
+        # site rather than mutating the process-wide tempfile.tempdir
         self.temp_dir = os.path.abspath(temp_dir)
         os.makedirs(self.temp_dir, exist_ok=True)
-        tempfile.tempdir = self.temp_dir
+
+        # One Downloader per loader; the wrapped storage client (and its
+        # connection pool) is then shared across every download this
+        # instance performs
+        if s3_client is not None:
+            self._downloader = Downloader(s3_client=s3_client, document_aws_bucket=document_aws_bucket)
+            self._download_impl = self._downloader.download_file_from_s3
+        elif gcs_client is not None:
+            self._downloader = Downloader(gcs_client=gcs_client, document_gcs_bucket=document_gcs_bucket)
+            self._download_impl = self._downloader.download_file_from_gcs
+        else:
+            self._downloader = None
+            self._download_impl = None
 
     def download_video(self, file_path: str, temp_file_path: str) -> str:
         """
@@ -79,18 +173,62 @@ class VideoLoader:
         Raises:
             ClientError: If download operation fails
         """
+        if self._download_impl is None:
+            raise AttributeError('Storage client not provided')
+        self._download_impl(file_path, temp_file_path)
+        logger.info(f'Downloaded {file_path} to {temp_file_path}')
+        return temp_file_path
+
+    def open_video_stream(self, file_path: str):
+        """
+        Open a streaming read handle on a video object in S3 or GCS.
+
+        Args:
+            file_path (str): Path to file in S3 or GCS bucket
+
+        Returns:
+            A readable binary file-like object over the remote video bytes.
+
+        Raises:
+            AttributeError: If no storage client is configured
+        """
         if self.s3_client is not None:
-            downloader = Downloader(s3_client=self.s3_client, document_aws_bucket=self.document_aws_bucket)
-            downloader.download_file_from_s3(file_path, temp_file_path)
-            logger.info(f'Downloaded {file_path} to {temp_file_path}')
-            return temp_file_path
+            return self.s3_client.get_object(Bucket=self.document_aws_bucket, Key=file_path)["Body"]
         elif self.gcs_client is not None:
-            downloader = Downloader(gcs_client=self.gcs_client, document_gcs_bucket=self.document_gcs_bucket)
-            downloader.download_file_from_gcs(file_path, temp_file_path)
-            logger.info(f'Downloaded {file_path} to {temp_file_path}')
-            return temp_file_path
+            return self.gcs_client.bucket(self.document_gcs_bucket).blob(file_path).open("rb")
         raise AttributeError('Storage client not provided')
 
+    def _cloud_video_to_audio(self, file_path: str) -> str:
+        """
+        Convert a cloud-hosted video to audio, overlapping download and transcode.
+
+        The remote bytes are piped straight into ffmpeg so the conversion
+        starts while the download is still in flight and no full-video temp
+        file is written; a read-ahead wrapper keeps the next chunks in
+        flight while ffmpeg consumes the current one. Containers that
+        cannot be demuxed from a pipe fall back to the original
+        download-then-convert path.
+
+        Args:
+            file_path (str): Path to file in S3 or GCS bucket
+
+        Returns:
+            str: Path to the converted audio file.
+        """
+        video_stream = _PrefetchStream(self.open_video_stream(file_path))
+        try:
+            return convert_video_stream_to_audio(video_stream=video_stream, bitrate_quality=self.bitrate_quality,
+                                                 temp_dir=self.temp_dir)
+        except ffmpeg.Error:
+            logger.warning(f"Streamed conversion failed for {file_path}, falling back to full download")
+        finally:
+            video_stream.close()
+
+        with get_temp_file_pool(self.temp_dir).acquire() as temp_file_path:
+            self.download_video(file_path, temp_file_path)
+            return convert_video_to_audio(video_file=temp_file_path, bitrate_quality=self.bitrate_quality,
+                                          temp_dir=self.temp_dir)
+
     # @staticmethod
     # def convert_video_to_audio_ffmpeg(video_file):
     #     """
@@ -145,48 +283,129 @@ class VideoLoader:
 
         logger.info("Starting text extraction from video...")
 
-        # Load or download the video file
-        if self.source == "cloud":
-            fd, temp_file_path = tempfile.mkstemp()
-            try:
-                temp_file_path = self.download_video(file_path, temp_file_path)
-                logger.info(f"Successfully loaded video file from {file_path}")
-                # saved_video_path = self.save_file_locally(temp_file_path, os.getcwd(), 'video')
-            finally:
-                os.close(fd)  # Close the file descriptor
-        elif self.source == "local":
-            temp_file_path = file_path
-            logger.info(f"Successfully loaded video file from local path {file_path}")
-        else:
-            raise ValueError("Invalid video source. Choose 'cloud', or 'local'.")
+        audio_path = self._video_to_audio(file_path)
+        return self._transcribe_audio_file(file_path, audio_path)
+
+    def get_text_from_local_video(self, file_path: str) -> dict:
+        """
+        Extract text from a local video file, skipping source dispatch entirely.
+
+        Thin fast path for callers that know the file is on disk: no source
+        lookup or cloud branches, straight into transcode and transcription.
+
+        Args:
+            file_path (str): Path to the local video file.
+
+        Returns:
+            dict: Extracted text and related metadata from the video.
+        """
+        return self._transcribe_audio_file(file_path, self._local_video_to_audio(file_path))
+
+    def _video_to_audio(self, file_path: str) -> str:
+        """
+        Convert a video (cloud or local) to audio, returning the audio path.
+
+        Args:
+            file_path (str): Path to the video file.
+
+        Returns:
+            str: Path to the converted audio file.
 
-        # Convert the video to audio
-        audio_path = convert_video_to_audio(video_file=temp_file_path, bitrate_quality=self.bitrate_quality)
+        Raises:
+            ValueError: If the configured source is not "cloud" or "local".
+        """
+        converter = self._AUDIO_CONVERTERS.get(self.source)
+        if converter is None:
+            raise ValueError("Invalid video source. Choose 'cloud', or 'local'.")
         # saved_audio_path = self.save_file_locally(audio_path, os.getcwd(), 'audio')
+        return converter(self, file_path)
+
+    def _local_video_to_audio(self, file_path: str) -> str:
+        """Convert a local video file to audio, returning the audio path."""
+        audio_path = convert_video_to_audio(video_file=file_path, bitrate_quality=self.bitrate_quality,
+                                            temp_dir=self.temp_dir)
+        logger.info(f"Successfully loaded video file from local path {file_path}")
+        return audio_path
 
-        # Get text from audio
-        result_dict = transcribe_full_audio(audio_file=audio_path,
-                                                 markdown_output=self.markdown_output,
-                                                 llm_api_key=self.llm_api_key,
-                                                 save_transcript_chunks=self.save_transcript_chunks,
-                                                 bitrate_quality=self.bitrate_quality,
-                                                 timeout_minutes=self.timeout_minutes
-                                                 )
+    # Source dispatch resolved once per call instead of chained comparisons
+    _AUDIO_CONVERTERS = {"cloud": _cloud_video_to_audio, "local": _local_video_to_audio}
+
+    def _transcribe_audio_file(self, file_path: str, audio_path: str) -> dict:
+        """
+        Transcribe an extracted audio file and finalize the result dict.
+
+        Args:
+            file_path (str): Original video path, recorded in the result.
+            audio_path (str): Path to the extracted audio file.
+
+        Returns:
+            dict: Extracted text and related metadata from the video.
+        """
+        # Get text from audio; identical audio with identical settings is
+        # served from the on-disk cache instead of re-running STT
+        cache_path = None
+        result_dict = None
+        if self.cache_enabled:
+            cache_path = result_cache_path(
+                self.temp_dir, audio_path,
+                int(self.markdown_output), int(self.save_transcript_chunks),
+            )
+            result_dict = load_cached_result(cache_path)
+            if result_dict is not None:
+                logger.info(f"Transcription cache hit for {file_path}")
+
+        if result_dict is None:
+            result_dict = transcribe_full_audio(audio_file=audio_path,
+                                                     markdown_output=self.markdown_output,
+                                                     llm_api_key=self.llm_api_key,
+                                                     save_transcript_chunks=self.save_transcript_chunks,
+                                                     bitrate_quality=self.bitrate_quality,
+                                                     timeout_minutes=self.timeout_minutes
+                                                     )
+            if cache_path is not None:
+                store_cached_result(cache_path, result_dict)
 
         result_dict["type"] = self.type
         result_dict["input"] = file_path
 
         # Clean up temporary files
-        logger.info(f"Removing temporary files: {temp_file_path} and {audio_path}")
-        if self.source == "cloud" and os.path.exists(temp_file_path):
-            os.remove(temp_file_path)
-            logger.info(f"Removed temporary file {temp_file_path}")
         if self.source == "cloud" and os.path.exists(audio_path):
             os.remove(audio_path)
             logger.info(f"Removed temporary file {audio_path}")
 
         return result_dict
 
+    def iter_texts_from_video(self, file_paths: list, prefetch: int = 2):
+        """
+        Yield transcription results for a batch of videos, in input order.
+
+        While video N is being transcribed, up to `prefetch` subsequent
+        videos are already being downloaded and converted to audio in
+        background threads, so the network/ffmpeg stage overlaps the STT
+        stage instead of running after it. The bounded prefetch window
+        keeps at most `prefetch` audio files on disk at a time.
+
+        Args:
+            file_paths (list): Paths to the video files.
+            prefetch (int, optional): Number of conversions to run ahead of
+                transcription. Defaults to 2.
+
+        Yields:
+            dict: Extracted text and related metadata, one per input path.
+        """
+        paths = iter(file_paths)
+        with ThreadPoolExecutor(max_workers=prefetch) as executor:
+            pending = deque(
+                (file_path, executor.submit(self._video_to_audio, file_path))
+                for file_path in itertools.islice(paths, prefetch)
+            )
+            while pending:
+                file_path, future = pending.popleft()
+                audio_path = future.result()
+                for next_path in itertools.islice(paths, 1):
+                    pending.append((next_path, executor.submit(self._video_to_audio, next_path)))
+                yield self._transcribe_audio_file(file_path, audio_path)
+
     @staticmethod
     def save_file_locally(source_path: str, destination_dir: str, file_type: str) -> str:
         """
@@ -215,9 +434,9 @@ class VideoLoader:
         # Create full destination path
         destination_path = os.path.join(destination_dir, new_filename)
 
-        # Copy the file
-        with open(source_path, 'rb') as src, open(destination_path, 'wb') as dst:
-            dst.write(src.read())
+        # Copy the file; shutil.copyfile uses sendfile/copy_file_range on
+        # Linux, so the bytes never pass through a userspace buffer
+        shutil.copyfile(source_path, destination_path)
 
         logger.info(f"Saved {file_type} file to: {destination_path}")
         return destination_path
@@ -232,4 +451,29 @@ class VideoLoader:
         Returns:
             dict: A dictionary containing the extracted text and related metadata.
         """
-        return self.get_text_from_video(file_path=input_path)
\ No newline at end of file
+        return self.get_text_from_video(file_path=input_path)
+
+    async def aload(self, input_paths: list, max_concurrency: int = 4) -> list[dict]:
+        """
+        Extract text from several videos concurrently from an event loop.
+
+        Each video runs the blocking download/transcode/transcribe pipeline
+        in a worker thread, so an async service can keep serving requests
+        while several videos are in flight. A semaphore bounds concurrency
+        since each video holds an ffmpeg process and an audio temp file.
+
+        Args:
+            input_paths (list): Paths to the video files.
+            max_concurrency (int, optional): Maximum extractions in flight.
+                Defaults to 4.
+
+        Returns:
+            list[dict]: One transcription result per input path, in input order.
+        """
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def extract(file_path):
+            async with semaphore:
+                return await asyncio.to_thread(self.get_text_from_video, file_path)
+
+        return list(await asyncio.gather(*[extract(file_path) for file_path in input_paths]))
\ No newline at end of file
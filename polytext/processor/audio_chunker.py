@@ -1,33 +1,103 @@
 import os
 import logging
 import tempfile
+import threading
 import uuid
 import ffmpeg
+import numpy as np
 from pydub import AudioSegment
 from typing import List, Tuple, Dict, Any
 from concurrent.futures import ThreadPoolExecutor, as_completed
 
 logger = logging.getLogger(__name__)
 
+# Window searched around each ideal cut point for a silent frame, the frame
+# granularity of the RMS scan, and the level below which a frame counts as
+# silent (pydub's -40 dBFS convention)
+SILENCE_SEARCH_WINDOW_MS = 10_000
+SILENCE_FRAME_MS = 50
+SILENCE_THRESHOLD_DBFS = -40.0
+
+# Mono 16 kHz is plenty for a silence scan and keeps the decoded window small
+SILENCE_SCAN_SAMPLE_RATE = 16000
+
+# Starting estimate of transcript tokens per minute of audio, refined at
+# runtime from completed transcriptions (see record_observed_tokens_per_minute)
+DEFAULT_TOKENS_PER_MINUTE = 200
+# EWMA weight of a new observation, and sanity bounds that keep one degenerate
+# file (silence, music) from skewing chunk sizing for the whole process
+TOKENS_PER_MINUTE_ALPHA = 0.3
+TOKENS_PER_MINUTE_MIN = 50
+TOKENS_PER_MINUTE_MAX = 1000
+
+_tpm_lock = threading.Lock()
+_learned_tpm = None
+
+
+def record_observed_tokens_per_minute(completion_tokens: int, duration_ms: int) -> None:
+    """
+    Feed a completed transcription back into the chunk-sizing estimate.
+
+    Args:
+        completion_tokens (int): Tokens the model produced for the audio.
+        duration_ms (int): Duration of the transcribed audio in milliseconds.
+    """
+    global _learned_tpm
+    if completion_tokens <= 0 or duration_ms <= 0:
+        return
+    observed = completion_tokens / (duration_ms / 60000)
+    observed = min(max(observed, TOKENS_PER_MINUTE_MIN), TOKENS_PER_MINUTE_MAX)
+    with _tpm_lock:
+        if _learned_tpm is None:
+            _learned_tpm = observed
+        else:
+            _learned_tpm = TOKENS_PER_MINUTE_ALPHA * observed + (1 - TOKENS_PER_MINUTE_ALPHA) * _learned_tpm
+    logger.info(f"Observed {observed:.0f} transcript tokens/minute; learned estimate now {_learned_tpm:.0f}")
+
+
+def learned_tokens_per_minute() -> float:
+    """Current tokens-per-minute estimate, falling back to the default."""
+    with _tpm_lock:
+        return _learned_tpm if _learned_tpm is not None else DEFAULT_TOKENS_PER_MINUTE
+
 class AudioChunker:
     def __init__(
             self,
             audio_path: str,
             max_llm_tokens: int = 8000,
             overlap_duration: int = 5000,
-            tokens_per_minute: int = 200,
+            tokens_per_minute: int = None,
             prompt_overhead: int = 500
     ) -> None:
         self.audio_path = audio_path
         self.max_llm_tokens = max_llm_tokens
         self.overlap_duration = overlap_duration
-        self.tokens_per_minute = tokens_per_minute
+        # Callers that don't pin a rate get the estimate learned from
+        # transcriptions completed earlier in the process
+        self.tokens_per_minute = tokens_per_minute if tokens_per_minute is not None else learned_tokens_per_minute()
         self.prompt_overhead = prompt_overhead
         self.chunk_temp_dir = os.path.abspath("temp")
         self.chunk_run_id = uuid.uuid4().hex[:8]
 
-        self.audio = AudioSegment.from_file(audio_path)
-        self.duration_ms = len(self.audio)
+        self.duration_ms = self._probe_duration_ms()
+
+    def _probe_duration_ms(self) -> int:
+        """
+        Get the audio duration in milliseconds without decoding it.
+
+        Uses ffprobe via `ffmpeg.probe`, which reads the container header
+        instead of decoding the whole file into PCM. Falls back to a full
+        pydub decode only if the container does not report a duration.
+
+        Returns:
+            int: Audio duration in milliseconds.
+        """
+        try:
+            probe = ffmpeg.probe(self.audio_path)
+            return int(float(probe["format"]["duration"]) * 1000)
+        except (ffmpeg.Error, KeyError, ValueError) as e:
+            logger.warning(f"ffprobe could not report a duration, decoding instead: {e}")
+            return len(AudioSegment.from_file(self.audio_path))
 
     def calculate_optimal_chunk_size(self) -> int:
         """Calculate optimal chunk size in milliseconds based on LLM token limit"""
@@ -39,6 +109,61 @@ class AudioChunker:
         # Cap at 80% of max to be safe
         return int(chunk_duration_ms * 0.8)
 
+    def _snap_to_silence(self, ideal_end: int) -> int:
+        """
+        Snap a cut point to the nearest silent frame around it.
+
+        Decodes only the window around `ideal_end` (mono 16-bit PCM via
+        ffmpeg `-ss`/`-t`, never the whole file) and scans it with a
+        vectorized per-frame RMS — one NumPy pass instead of pydub's per-
+        millisecond Python loop — returning the centre of the silent frame
+        closest to the ideal cut. Falls back to `ideal_end` when the
+        window contains no silence (continuous speech/music) or cannot be
+        decoded.
+
+        Args:
+            ideal_end (int): Proposed cut point in milliseconds.
+
+        Returns:
+            int: Silence-aligned cut point in milliseconds.
+        """
+        window_start = max(0, ideal_end - SILENCE_SEARCH_WINDOW_MS)
+        window_end = min(self.duration_ms, ideal_end + SILENCE_SEARCH_WINDOW_MS)
+        try:
+            raw, _ = (
+                ffmpeg
+                .input(self.audio_path,
+                       ss=window_start / 1000,
+                       t=(window_end - window_start) / 1000)
+                .output('pipe:',
+                        format='s16le',
+                        acodec='pcm_s16le',
+                        ac=1,
+                        ar=SILENCE_SCAN_SAMPLE_RATE)
+                .run(capture_stdout=True, quiet=True)
+            )
+        except ffmpeg.Error as e:
+            logger.warning(f"Could not decode silence-scan window at {ideal_end}ms: {e}")
+            return ideal_end
+
+        samples = np.frombuffer(raw, dtype=np.int16)
+
+        frame_size = int(SILENCE_SCAN_SAMPLE_RATE * SILENCE_FRAME_MS / 1000)
+        n_frames = len(samples) // frame_size
+        if n_frames == 0:
+            return ideal_end
+        frames = samples[:n_frames * frame_size].astype(np.float64).reshape(n_frames, frame_size)
+        rms = np.sqrt(np.mean(frames * frames, axis=1))
+
+        threshold = float(2 ** 15) * (10 ** (SILENCE_THRESHOLD_DBFS / 20))
+        silent_frames = np.nonzero(rms < threshold)[0]
+        if len(silent_frames) == 0:
+            return ideal_end
+
+        ideal_frame = (ideal_end - window_start) // SILENCE_FRAME_MS
+        nearest = silent_frames[np.argmin(np.abs(silent_frames - ideal_frame))]
+        return window_start + int(nearest) * SILENCE_FRAME_MS + SILENCE_FRAME_MS // 2
+
     def find_chunk_boundaries(self) -> List[Tuple[int, int]]:
         """Find optimal chunk boundaries at natural silence points"""
         logger.info("Finding optimal chunk boundaries...")
@@ -50,8 +175,9 @@ class AudioChunker:
 
         while start < self.duration_ms:
             logger.info(f"\nProcessing chunk starting at {start}ms")
-            # Calculate the ideal end point for this chunk
-            ideal_end = start + optimal_chunk_ms
+            # Calculate the ideal end point for this chunk, nudged onto the
+            # closest silence so cuts land between words rather than inside them
+            ideal_end = self._snap_to_silence(start + optimal_chunk_ms)
             logger.info(f"Ideal end point: {ideal_end}ms")
 
             # If we're near the end, just include everything remaining
@@ -130,9 +256,11 @@ class AudioChunker:
                 "transcript": None
             }]
 
-        # Process chunks in parallel
+        # Process chunks in parallel; each worker spawns an ffmpeg encode, so
+        # cap the pool at the CPU count to avoid oversubscribing the encoder
         chunks = [None] * len(boundaries)
-        with ThreadPoolExecutor() as executor:
+        max_workers = min(8, os.cpu_count() or 1, len(boundaries))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
             # Submit all chunks to thread pool
             future_to_chunk = {
                 executor.submit(self._process_single_chunk, (i, boundary)): i
@@ -1,5 +1,6 @@
 # processor/text_merger.py
 import re
+import difflib
 import logging
 from retry import retry
 from google import genai
@@ -13,6 +14,13 @@ from ..prompts.text_merging import TEXT_MERGE_PROMPT
 
 logger = logging.getLogger(__name__)
 
+# Compiled once at import; merge_texts runs on every chunk pair
+_WORD_RE = re.compile(r'\b\w+\b')
+
+# Generous character budget per word when slicing the tail of text1 for
+# tokenization, so the k+20 word window is always fully covered
+_TAIL_CHARS_PER_WORD = 40
+
 class TextMerger:
     def __init__(
             self,
@@ -43,63 +51,62 @@ class TextMerger:
         Returns:
             str: The merged text, or original texts concatenated if no good merge point found
         """
-        # Clean and split the texts into words
-        import re
+        char_position = self._find_merge_cut(text1, text2)
+        if char_position == -1:
+            # If no good merge found, just concatenate the texts
+            return text1 + " " + text2
+
+        # Keep text1 up to the match point, then text2 from its start
+        # (text2 re-supplies the overlapping words)
+        return text1[:char_position] + " " + text2
+
+    def _find_merge_cut(self, text1: str, text2: str) -> int:
+        """
+        Find the character offset in text1 where text2 should take over.
 
-        def clean_and_split(text):
-            # Convert to lowercase and split by whitespace
-            return re.findall(r'\b\w+\b', text.lower())
+        Args:
+            text1 (str): The first text (beginning part)
+            text2 (str): The second text (ending part)
 
-        words1 = clean_and_split(text1)
-        words2 = clean_and_split(text2)
+        Returns:
+            int: Offset into text1 of the merge point, or -1 when the texts
+                share no sufficient overlap and should be concatenated.
+        """
+        # Only the last k+20 words of text1 can participate in the merge, so
+        # tokenize a bounded tail slice instead of the whole (growing) text.
+        # This keeps each merge_chunks iteration proportional to the overlap
+        # window rather than to the document merged so far.
+        tail_start = max(0, len(text1) - (self.k + 20) * _TAIL_CHARS_PER_WORD)
+        tokens1 = list(_WORD_RE.finditer(text1[tail_start:].lower()))
+        words1 = [m.group() for m in tokens1]
+        words2 = _WORD_RE.findall(text2.lower())
 
         if len(words2) < self.k or len(words1) < self.k:
-            return text1 + " " + text2  # Texts too short for meaningful merge
+            return -1  # Texts too short for meaningful merge
 
         # Get the first k words of text2
         search_words = words2[:self.k]
 
         # Maximum number of words to check in text1 (last k+20 words)
         check_length = min(len(words1), self.k + 20)
+        window_offset = len(words1) - check_length
+        window = words1[window_offset:]
 
-        best_match_count = 0
-        best_match_position = -1
-
-        # Check each possible position in the last part of text1
-        for i in range(max(0, len(words1) - check_length), len(words1) - self.k + 1):
-            matches = 0
-            for j in range(self.k):
-                if i + j < len(words1) and words1[i + j] == search_words[j]:
-                    matches += 1
-
-            if matches > best_match_count:
-                best_match_count = matches
-                best_match_position = i
-
-        # If we found enough matching words, perform the merge
-        if best_match_count >= self.min_matches and best_match_position != -1:
-            # Find the position in the original text1 that corresponds to best_match_position
-            # We need to map from word index to character index
-            char_position = 0
-            word_count = 0
-
-            for m in re.finditer(r'\b\w+\b', text1.lower()):
-                if word_count == best_match_position:
-                    char_position = m.start()
-                    break
-                word_count += 1
-
-            # Get all of text1 up to the match point
-            merged_text = text1[:char_position]
-
-            # Add text2 content from after the matching section
-            # We're being cautious here, keeping k words and then adding the rest
-            merged_text += " " + text2
+        # Find the longest run of consecutive words shared by the tail of
+        # text1 and the start of text2 (linear-time, vs the old nested loop)
+        match = difflib.SequenceMatcher(
+            None, window, search_words, autojunk=False
+        ).find_longest_match(0, len(window), 0, len(search_words))
 
-            return merged_text
+        # Not enough matching words to trust the overlap
+        if match.size < self.min_matches:
+            return -1
 
-        # If no good merge found, just concatenate the texts
-        return text1 + " " + text2
+        # Align the match so it points at where search_words[0] would fall
+        # in text1, then map the word index back to a character index via
+        # the spans captured during tokenization
+        best_match_position = max(0, window_offset + match.a - match.b)
+        return tail_start + tokens1[best_match_position].start()
 
     def merge_chunks(self, chunks: List[str]) -> str:
         """
@@ -113,19 +120,23 @@ class TextMerger:
         Returns
         -------
         str
-            One continuous piece of text produced by repeatedly calling
-            `merge_texts` on successive pairs:
-            result = merge_texts(chunk_1, chunk_2)
-            result = merge_texts(result,  chunk_3)
-            …
+            One continuous piece of text, equivalent to repeatedly merging
+            successive pairs with `merge_texts` but built from a list of
+            pieces joined once at the end, so no intermediate copy of the
+            growing document is ever allocated.
         """
         if not chunks:                     # Handle an empty list gracefully
             return ""
 
-        merged = chunks[0]
+        # The merge cut always lands in the last k+20 words, i.e. inside the
+        # most recent piece, so only that piece ever needs trimming
+        pieces = [chunks[0]]
         for nxt in chunks[1:]:
-            merged = self.merge_texts(merged, nxt)
-        return merged
+            cut = self._find_merge_cut(pieces[-1], nxt)
+            if cut != -1:
+                pieces[-1] = pieces[-1][:cut]
+            pieces.append(" " + nxt)
+        return "".join(pieces)
 
 
     @staticmethod
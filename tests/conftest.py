@@ -0,0 +1,22 @@
+# Standard library imports
+import os
+
+# External library imports
+import pytest
+from dotenv import load_dotenv
+
+# Repo root, resolved once: .env and the polytext package both live there
+_REPO_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _env():
+    """
+    Load .env once per test session.
+
+    Replaces the per-module ``sys.path.insert`` / ``load_dotenv`` boilerplate
+    the test files used to carry: the path adjustment now comes from the
+    ``pythonpath`` entry in pyproject.toml, and the .env file is parsed a
+    single time here instead of once per collected module.
+    """
+    load_dotenv(os.path.join(_REPO_ROOT, ".env"))
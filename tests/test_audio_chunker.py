@@ -6,28 +6,25 @@ from polytext.processor.audio_chunker import AudioChunker
 
 
 class TestAudioChunker(unittest.TestCase):
-    @patch("polytext.processor.audio_chunker.AudioSegment.from_file")
-    def test_optimal_chunk_size_is_about_15_minutes_with_4250_max_tokens(self, mock_from_file):
-        fake_audio = MagicMock()
-        fake_audio.__len__.return_value = 3_600_000
-        mock_from_file.return_value = fake_audio
+    @patch("polytext.processor.audio_chunker.ffmpeg.probe")
+    def test_optimal_chunk_size_is_about_15_minutes_with_4250_max_tokens(self, mock_probe):
+        mock_probe.return_value = {"format": {"duration": "3600"}}
 
-        chunker = AudioChunker(audio_path="/tmp/dummy.mp3", max_llm_tokens=4250)
+        chunker = AudioChunker(audio_path="/tmp/dummy.mp3", max_llm_tokens=4250,
+                               tokens_per_minute=200)
 
         self.assertEqual(chunker.calculate_optimal_chunk_size(), 900_000)
 
     @patch("polytext.processor.audio_chunker.ffmpeg.run")
     @patch("polytext.processor.audio_chunker.ffmpeg.input")
-    @patch("polytext.processor.audio_chunker.AudioSegment.from_file")
+    @patch("polytext.processor.audio_chunker.ffmpeg.probe")
     def test_process_single_chunk_uses_unique_temp_file_across_instances(
         self,
-        mock_from_file,
+        mock_probe,
         mock_ffmpeg_input,
         _mock_ffmpeg_run,
     ):
-        fake_audio = MagicMock()
-        fake_audio.__len__.return_value = 10_000
-        mock_from_file.return_value = fake_audio
+        mock_probe.return_value = {"format": {"duration": "10"}}
 
         fake_stream = MagicMock()
         mock_ffmpeg_input.return_value.output.return_value.overwrite_output.return_value = fake_stream
@@ -104,6 +104,9 @@ class _ImmediateFuture:
 
 
 class _ImmediateExecutor:
+    def __init__(self, *args, **kwargs):
+        pass
+
     def __enter__(self):
         return self
 
@@ -139,6 +142,7 @@ class TestAudioTranscriptionModelMigration(unittest.TestCase):
         mock_text_merger_cls,
     ):
         fake_chunker = MagicMock()
+        fake_chunker.duration_ms = 600_000
         mock_chunker_cls.return_value = fake_chunker
         fake_chunker.extract_chunks.return_value = [{"file_path": "/tmp/fake_chunk.mp3"}]
         mock_process_chunk.return_value = (
@@ -410,6 +414,7 @@ class TestAudioTranscriptionModelMigration(unittest.TestCase):
         mock_client_cls.return_value = fake_client
 
         fake_chunker = MagicMock()
+        fake_chunker.duration_ms = 600_000
         mock_chunker_cls.return_value = fake_chunker
         mock_text_merger_cls.return_value.merge_chunks_with_llm_sequential.return_value = {
             "full_text_merged": "chunk one transcript\nchunk two fallback transcript",
@@ -456,6 +461,7 @@ class TestAudioTranscriptionModelMigration(unittest.TestCase):
         _mock_as_completed,
     ):
         fake_chunker = MagicMock()
+        fake_chunker.duration_ms = 600_000
         mock_chunker_cls.return_value = fake_chunker
         fake_chunker.extract_chunks.return_value = [
             {"file_path": "/tmp/fake_chunk.mp3"},
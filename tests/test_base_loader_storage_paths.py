@@ -0,0 +1,37 @@
+import unittest
+from unittest.mock import Mock, patch
+
+from polytext.loader.base import BaseLoader
+
+
+class TestBaseLoaderStoragePaths(unittest.TestCase):
+    def test_s3_input_returns_client_bucket_and_file_path(self):
+        fake_client = Mock()
+        with patch("polytext.loader.base._get_s3_client", return_value=fake_client):
+            storage_client = BaseLoader().initiate_storage(input="s3://bucket/path/to/key.pdf")
+
+        self.assertIs(storage_client["s3_client"], fake_client)
+        self.assertEqual(storage_client["document_aws_bucket"], "bucket")
+        self.assertEqual(storage_client["file_path"], "path/to/key.pdf")
+
+    def test_s3_scheme_inside_key_is_preserved(self):
+        with patch("polytext.loader.base._get_s3_client", return_value=Mock()):
+            storage_client = BaseLoader().initiate_storage(input="s3://bucket/dir/s3://odd-key.pdf")
+
+        self.assertEqual(storage_client["file_path"], "dir/s3://odd-key.pdf")
+
+    def test_gcs_input_returns_client_bucket_and_file_path(self):
+        fake_client = Mock()
+        with patch("polytext.loader.base._get_gcs_client", return_value=fake_client):
+            storage_client = BaseLoader().initiate_storage(input="gcs://bucket/key.pdf")
+
+        self.assertIs(storage_client["gcs_client"], fake_client)
+        self.assertEqual(storage_client["document_gcs_bucket"], "bucket")
+        self.assertEqual(storage_client["file_path"], "key.pdf")
+
+    def test_http_input_returns_empty_dict(self):
+        self.assertEqual(BaseLoader().initiate_storage(input="https://example.com/page"), {})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,14 +1,8 @@
 import logging
-import os
-import sys
 
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
-
-from dotenv import load_dotenv
 
 from polytext.loader.base import BaseLoader
 
-load_dotenv("..env")
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger("polytext")
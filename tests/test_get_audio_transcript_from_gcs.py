@@ -1,12 +1,8 @@
-import os
-import sys
 import logging
 import time
+import os
+from pathlib import Path
 
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
-
-from dotenv import load_dotenv
-load_dotenv(".env")
 
 from polytext.loader.base import BaseLoader
 
@@ -43,12 +39,12 @@ def main():
     end = time.time()
     print("Time elapsed: ", end - start)
 
-    import ipdb; ipdb.set_trace()
+    if os.getenv("POLYTEXT_DEBUG"): breakpoint()
 
     try:
         output_file = "test_gemini_31_2.md" if markdown_output else "transcript.txt"
-        with open(output_file, "w", encoding="utf-8") as f:
-            f.write(result_dict["text"])
+        # Single write(2) of the encoded bytes; skips TextIOWrapper buffering
+        Path(output_file).write_bytes(result_dict["text"].encode("utf-8"))
         print(f"Transcript saved to {output_file}")
     except IOError as e:
         logging.error(f"Failed to save transcript: {str(e)}")
@@ -1,11 +1,5 @@
-import os
-import sys
 import logging
 
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
-
-from dotenv import load_dotenv
-load_dotenv(".env")
 
 from polytext.generator.pdf import PDFGenerator
 
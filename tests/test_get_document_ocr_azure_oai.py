@@ -1,13 +1,9 @@
 import os
-import sys
+from pathlib import Path
 from google.cloud import storage
 import logging
 import boto3
 
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
-
-from dotenv import load_dotenv
-load_dotenv(".env")
 
 from polytext.loader.document_ocr import DocumentOCRLoader
 
@@ -56,15 +52,15 @@ def main():
             file_path=local_file_path,
         )
 
-        import ipdb; ipdb.set_trace()
+        if os.getenv("POLYTEXT_DEBUG"): breakpoint()
 
         print(f"Successfully extracted text ({len(result_dict['text'])} characters)")
         #print("Sample of extracted text:")
         #print(document_text[:500] + "...")  # Print first 500 chars
 
         # Optionally save the extracted text to a file
-        with open("extracted_text.txt", "w", encoding="utf-8") as f:
-            f.write(result_dict['text'])
+        # Single write(2) of the encoded bytes; skips TextIOWrapper buffering
+        Path("extracted_text.txt").write_bytes(result_dict['text'].encode("utf-8"))
 
     except Exception as e:
         logging.error(f"Error extracting text: {str(e)}")
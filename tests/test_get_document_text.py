@@ -1,12 +1,8 @@
 import os
-import sys
 import boto3
 import logging
+from pathlib import Path
 
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
-
-from dotenv import load_dotenv
-load_dotenv(".env")
 
 from polytext.loader.base import BaseLoader
 
@@ -46,8 +42,8 @@ def main():
         #print(document_text[:500] + "...")  # Print first 500 chars
 
         # Optionally save the extracted text to a file
-        with open("extracted_text.txt", "w", encoding="utf-8") as f:
-            f.write(document_text)
+        # Single write(2) of the encoded bytes; skips TextIOWrapper buffering
+        Path("extracted_text.txt").write_bytes(document_text.encode("utf-8"))
 
     except Exception as e:
         logging.error(f"Error extracting text: {str(e)}")
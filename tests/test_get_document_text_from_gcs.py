@@ -1,13 +1,9 @@
 import os
-import sys
+from pathlib import Path
 from google.cloud import storage
 import logging
 import boto3
 
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
-
-from dotenv import load_dotenv
-load_dotenv(".env")
 
 from polytext.loader.base import BaseLoader
 from polytext.exceptions.base import EmptyDocument
@@ -62,15 +58,15 @@ def main():
             input_list=[file_path],
         )
 
-        import ipdb; ipdb.set_trace()
+        if os.getenv("POLYTEXT_DEBUG"): breakpoint()
 
         print(f"Successfully extracted text ({len(result_dict['text'])} characters)")
         #print("Sample of extracted text:")
         #print(document_text[:500] + "...")  # Print first 500 chars
 
         # Optionally save the extracted text to a file
-        with open("md_4_doc.md", "w", encoding="utf-8") as f:
-            f.write(result_dict['text'])
+        # Single write(2) of the encoded bytes; skips TextIOWrapper buffering
+        Path("md_4_doc.md").write_bytes(result_dict['text'].encode("utf-8"))
 
     except EmptyDocument as e:
         logging.error(f"Empty document error: {str(e)}")
@@ -1,12 +1,8 @@
 import os
-import sys
+from pathlib import Path
 from google.cloud import storage
 import logging
 
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
-
-from dotenv import load_dotenv
-load_dotenv(".env")
 
 # from polytext.loader import MarkdownLoader
 from polytext.loader import BaseLoader
@@ -54,12 +50,12 @@ def main():
             input_list=[file_path],
         )
 
-        import ipdb; ipdb.set_trace()
+        if os.getenv("POLYTEXT_DEBUG"): breakpoint()
 
         try:
             output_file = "markdown_text.md" if markdown_output else "markdown_text.txt"
-            with open(output_file, "w", encoding="utf-8") as f:
-                f.write(document_text["text"])
+            # Single write(2) of the encoded bytes; skips TextIOWrapper buffering
+            Path(output_file).write_bytes(document_text["text"].encode("utf-8"))
             print(f"Markdown text saved to {output_file}")
         except IOError as e:
             logging.error(f"Failed to save markdown text: {str(e)}")
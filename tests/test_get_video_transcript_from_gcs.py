@@ -1,12 +1,8 @@
 import os
-import sys
+from pathlib import Path
 from google.cloud import storage
 import logging
 
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
-
-from dotenv import load_dotenv
-load_dotenv(".env")
 
 from polytext.loader.base import BaseLoader
 
@@ -40,12 +36,12 @@ def main():
     # Call get_document_text method
     result_dict = loader.get_text(input_list=[file_url])
 
-    import ipdb; ipdb.set_trace()
+    if os.getenv("POLYTEXT_DEBUG"): breakpoint()
 
     try:
         output_file = "transcript.md" if markdown_output else "transcript.txt"
-        with open(output_file, "w", encoding="utf-8") as f:
-            f.write(result_dict["text"])
+        # Single write(2) of the encoded bytes; skips TextIOWrapper buffering
+        Path(output_file).write_bytes(result_dict["text"].encode("utf-8"))
         print(f"Transcript saved to {output_file}")
     except IOError as e:
         logging.error(f"Failed to save transcript: {str(e)}")
@@ -1,4 +1,5 @@
 import logging
+import os
 from polytext.loader import BaseLoader
 
 # Set up logging
@@ -26,4 +27,4 @@ except Exception as e:
     logger.error(f"Error processing file: {str(e)}")
     logger.debug(f"Temp file location: {text_loader.temp_dir}")
 
-import ipdb; ipdb.set_trace()
\ No newline at end of file
+if os.getenv("POLYTEXT_DEBUG"): breakpoint()
\ No newline at end of file
@@ -1,13 +1,8 @@
-import os
-import sys
 import logging
+from pathlib import Path
 
 from polytext.loader.base import BaseLoader
 
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
-
-from dotenv import load_dotenv
-load_dotenv(".env")
 
 # Set up logging
 logging.basicConfig(level=logging.INFO,
@@ -24,8 +19,8 @@ def main():
     try:
         result_dict = loader.get_text(input_list=[url])
 
-        with open("md_2_medium.md", "w", encoding="utf-8") as f:
-            f.write(result_dict['text'])
+        # Single write(2) of the encoded bytes; skips TextIOWrapper buffering
+        Path("md_2_medium.md").write_bytes(result_dict['text'].encode("utf-8"))
 
         return result_dict
 
@@ -1,8 +1,6 @@
 import os
-import sys
 import logging
 
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
 from polytext.loader import BaseLoader
 
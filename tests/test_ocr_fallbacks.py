@@ -7,6 +7,7 @@ from polytext.converter.document_ocr_to_text import DocumentOCRToTextConverter
 from polytext.converter.document_ocr_to_text_azure_oai import (
     DocumentOCRToTextConverter as AzureDocumentOCRToTextConverter,
 )
+from polytext.converter import ocr_to_text as ocr_to_text_module
 from polytext.converter.ocr_to_text import OCRToTextConverter
 from polytext.exceptions import EmptyDocument
 
@@ -112,6 +113,11 @@ def _immediate_as_completed(futures):
 
 
 class TestOcrFallbacks(unittest.TestCase):
+    def setUp(self):
+        # The converter caches genai clients per API key; drop them so each
+        # test's patched genai.Client is the one actually used
+        ocr_to_text_module._get_genai_client.cache_clear()
+
     def test_default_ocr_max_output_tokens_is_8192(self):
         converter = OCRToTextConverter()
         self.assertEqual(converter.max_output_tokens, 8192)
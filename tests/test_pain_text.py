@@ -1,11 +1,6 @@
-import os
-import sys
 import logging
+import os
 
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
-
-from dotenv import load_dotenv
-load_dotenv('..env')
 
 from polytext.loader.base import BaseLoader
 
@@ -27,7 +22,7 @@ def main():
         input_list=[plain_text]
     )
 
-    import ipdb; ipdb.set_trace()
+    if os.getenv("POLYTEXT_DEBUG"): breakpoint()
 
     return result_dict
 
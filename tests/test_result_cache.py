@@ -0,0 +1,56 @@
+import os
+import tempfile
+import unittest
+
+from polytext.loader._result_cache import (
+    result_cache_path,
+    load_cached_result,
+    store_cached_result,
+)
+
+
+class TestResultCache(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.doc_path = os.path.join(self.temp_dir, "doc.pdf")
+        with open(self.doc_path, "wb") as f:
+            f.write(b"document bytes")
+
+    def test_store_then_load_round_trips_result(self):
+        cache_path = result_cache_path(self.temp_dir, self.doc_path, 1, "model-a")
+        store_cached_result(cache_path, {"text": "cached", "completion_tokens": 5})
+
+        self.assertEqual(
+            load_cached_result(cache_path),
+            {"text": "cached", "completion_tokens": 5},
+        )
+
+    def test_miss_returns_none(self):
+        cache_path = result_cache_path(self.temp_dir, self.doc_path, 1, "model-a")
+        self.assertIsNone(load_cached_result(cache_path))
+
+    def test_same_bytes_different_settings_use_different_entries(self):
+        markdown = result_cache_path(self.temp_dir, self.doc_path, 1, "model-a")
+        plain = result_cache_path(self.temp_dir, self.doc_path, 0, "model-a")
+        self.assertNotEqual(markdown, plain)
+
+    def test_same_bytes_same_settings_share_an_entry(self):
+        copy_path = os.path.join(self.temp_dir, "copy.pdf")
+        with open(copy_path, "wb") as f:
+            f.write(b"document bytes")
+
+        self.assertEqual(
+            result_cache_path(self.temp_dir, self.doc_path, 1, "model-a"),
+            result_cache_path(self.temp_dir, copy_path, 1, "model-a"),
+        )
+
+    def test_unreadable_entry_is_treated_as_miss(self):
+        cache_path = result_cache_path(self.temp_dir, self.doc_path, 1, "model-a")
+        with open(cache_path, "w", encoding="utf-8") as f:
+            f.write("{not json")
+
+        self.assertIsNone(load_cached_result(cache_path))
+
+
+if __name__ == "__main__":
+    unittest.main()
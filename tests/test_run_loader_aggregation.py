@@ -0,0 +1,64 @@
+import unittest
+
+from polytext.loader.base import BaseLoader
+
+
+class _StubImageLoader:
+    def __init__(self):
+        self.calls = []
+
+    def load(self, input_path):
+        self.calls.append(input_path)
+        return {
+            "text": f"text for {input_path}",
+            "completion_tokens": 3,
+            "prompt_tokens": 7,
+            "completion_model": "stub-model",
+            "completion_model_provider": "stub-provider",
+        }
+
+
+class TestRunLoaderAggregation(unittest.TestCase):
+    def test_multi_image_totals_sum_each_token_kind_separately(self):
+        loader = _StubImageLoader()
+        result = BaseLoader(source="local").run_loader_class(
+            loader_class=loader, input_list=["a.png", "b.png", "c.png"]
+        )
+
+        self.assertEqual(result["completion_tokens"], 9)
+        self.assertEqual(result["prompt_tokens"], 21)
+        self.assertEqual(
+            result["text"], "text for a.png text for b.png text for c.png"
+        )
+
+    def test_duplicate_inputs_are_loaded_once_but_texts_repeat(self):
+        loader = _StubImageLoader()
+        result = BaseLoader(source="local").run_loader_class(
+            loader_class=loader, input_list=["a.png", "b.png", "a.png"]
+        )
+
+        self.assertEqual(sorted(loader.calls), ["a.png", "b.png"])
+        self.assertEqual(result["completion_tokens"], 6)
+        self.assertEqual(result["prompt_tokens"], 14)
+        self.assertEqual(
+            result["text"], "text for a.png text for b.png text for a.png"
+        )
+
+    def test_single_input_passes_through_loader_result(self):
+        result = BaseLoader(source="local").run_loader_class(
+            loader_class=_StubImageLoader(), input_list=["only.png"]
+        )
+
+        self.assertEqual(result["completion_tokens"], 3)
+        self.assertEqual(result["prompt_tokens"], 7)
+        self.assertEqual(result["output_list"][0]["completion_model"], "stub-model")
+
+    def test_multi_input_non_image_is_rejected(self):
+        with self.assertRaises(ValueError):
+            BaseLoader(source="local").run_loader_class(
+                loader_class=_StubImageLoader(), input_list=["a.pdf", "b.pdf"]
+            )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -2,14 +2,9 @@ import time
 import logging
 import mimetypes
 import os
-import sys
 from google import genai
 from google.genai import types
 
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
-
-from dotenv import load_dotenv
-load_dotenv(".env")
 
 logger = logging.getLogger(__name__)
 
@@ -133,5 +128,5 @@ response = split_audio(file_path)
 
 print(response)
 
-import ipdb; ipdb.set_trace()
+if os.getenv("POLYTEXT_DEBUG"): breakpoint()
 
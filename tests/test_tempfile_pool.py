@@ -0,0 +1,39 @@
+import os
+import tempfile
+import unittest
+
+from polytext.loader._tempfile_pool import TempFilePool
+
+
+class TestTempFilePool(unittest.TestCase):
+    def setUp(self):
+        self.dir = tempfile.mkdtemp()
+        self.pool = TempFilePool(dir=self.dir, size=2)
+
+    def test_released_path_is_reused(self):
+        with self.pool.acquire() as first:
+            pass
+        with self.pool.acquire() as second:
+            self.assertEqual(first, second)
+
+    def test_release_truncates_written_file(self):
+        with self.pool.acquire() as path:
+            with open(path, "wb") as f:
+                f.write(b"stale bytes")
+        with self.pool.acquire() as path:
+            self.assertEqual(os.path.getsize(path), 0)
+
+    def test_release_recreates_deleted_file(self):
+        with self.pool.acquire() as path:
+            os.remove(path)
+        with self.pool.acquire() as path:
+            self.assertTrue(os.path.exists(path))
+
+    def test_distinct_paths_when_pool_not_exhausted(self):
+        with self.pool.acquire() as first:
+            with self.pool.acquire() as second:
+                self.assertNotEqual(first, second)
+
+
+if __name__ == "__main__":
+    unittest.main()
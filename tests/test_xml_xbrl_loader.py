@@ -10,7 +10,6 @@ sys.modules["weasyprint.text.ffi"] = MagicMock()
 sys.modules["weasyprint.text.fonts"] = MagicMock()
 sys.modules["weasyprint.css"] = MagicMock()
 
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
 from polytext.loader.base import BaseLoader
 
@@ -1,14 +1,10 @@
 import os
 import unittest
 
-from dotenv import load_dotenv
 from google import genai
 from google.genai import errors, types
 
 
-load_dotenv(".env")
-
-
 DEFAULT_YOUTUBE_URL = "https://www.youtube.com/watch?v=FvfsFk2p1J0"
 DEFAULT_MODEL = "models/gemini-3.1-flash-lite-preview"
 REFERENCE_YOUTUBE_URL = "https://www.youtube.com/watch?v=9hE5-98ZeCg"
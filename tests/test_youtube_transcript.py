@@ -1,5 +1,4 @@
 import os
-import sys
 import time
 from datetime import datetime
 import logging
@@ -10,10 +9,6 @@ logging.basicConfig(
     force=True,
 )
 
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
-
-from dotenv import load_dotenv
-load_dotenv('..env')
 
 from polytext.loader.base import BaseLoader
 